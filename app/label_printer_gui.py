@@ -6,35 +6,39 @@ Prints labels with box icon, QR code, and text
 
 import sys
 import os
+import atexit
 import json
+import re
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QGroupBox,
     QFileDialog, QMessageBox, QScrollArea, QToolButton, QTabWidget,
     QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QDialog,
-    QDialogButtonBox, QFormLayout
+    QDialogButtonBox, QFormLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSettings, QTimer
-from PyQt6.QtGui import QPixmap, QFont, QAction, QKeySequence, QIcon
-from PIL import Image, ImageDraw, ImageFont
-import qrcode
-from brother_ql.raster import BrotherQLRaster
-from brother_ql.conversion import convert
-from brother_ql.backends.helpers import send, discover
-
-
-@contextmanager
-def suppress_stderr():
-    """Temporarily suppress stderr output"""
-    original_stderr = sys.stderr
-    sys.stderr = open(os.devnull, 'w')
-    try:
-        yield
-    finally:
-        sys.stderr.close()
-        sys.stderr = original_stderr
+from PyQt6.QtCore import (
+    Qt, QSettings, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker,
+    pyqtSignal
+)
+from PyQt6.QtGui import (
+    QPixmap, QPixmapCache, QImage, QFont, QColor, QAction, QKeySequence, QShortcut, QIcon,
+    qRgb
+)
+from PIL import Image
+from brother_ql.backends import backend_factory
+from brother_ql.backends.helpers import discover
+from brother_ql.reader import interpret_response
+
+
+# Per-process scratch directory for files handed to scp (removed at exit)
+_TMPDIR = tempfile.mkdtemp(prefix="brother_ql_")
+atexit.register(shutil.rmtree, _TMPDIR, ignore_errors=True)
 
 
 def get_cups_printers():
@@ -87,22 +91,22 @@ def get_printer_uri(printer_name):
     return None
 
 
-def print_label_image(image_path, printer_name, label_size, copies=1):
+def print_label_image(image, printer_name, label_size, copies=1, cut_every=1):
     """Print a label image to a Brother QL printer.
 
     Automatically detects if printer is local USB or network and routes accordingly.
 
     Args:
-        image_path: Path to the image file to print
+        image: PIL image (or path to an image file) to print
         printer_name: CUPS printer name
         label_size: Label width in mm (e.g., 62)
         copies: Number of copies to print
+        cut_every: Cut after every N labels on local USB printers (the last is always cut)
 
     Returns:
         tuple: (success: bool, message: str)
     """
     import subprocess
-    import re
 
     if not printer_name:
         return False, "No printer selected. Please select a printer in Settings."
@@ -115,13 +119,20 @@ def print_label_image(image_path, printer_name, label_size, copies=1):
     # Determine if local USB or network printer
     if uri.startswith('usb://') or uri.startswith('file://'):
         # Local USB printer - use brother_ql directly
-        return print_local_usb(image_path, label_size, copies)
+        return print_local_usb(image, label_size, copies, cut_every)
     elif 'ipp://' in uri or 'ipps://' in uri:
         # Network printer - extract host and use SSH + brother_ql
         # Parse host from URI like ipp://10.0.0.4:631/printers/QL-700
         match = re.search(r'ipps?://([^:/]+)', uri)
         if match:
             host = match.group(1)
+            # scp needs a file; write in-memory images to this process's temp dir
+            # (fast zlib level: the file is small either way and decoded right back)
+            if isinstance(image, Image.Image):
+                image_path = os.path.join(_TMPDIR, "print.png")
+                image.save(image_path, compress_level=1)
+            else:
+                image_path = image
             return print_via_ssh(image_path, host, label_size, copies)
         else:
             return False, f"Could not parse host from URI: {uri}"
@@ -129,50 +140,112 @@ def print_label_image(image_path, printer_name, label_size, copies=1):
         return False, f"Unsupported printer URI: {uri}"
 
 
-def print_local_usb(image_path, label_size, copies=1):
-    """Print to a locally connected USB Brother QL printer using brother_ql."""
-    from brother_ql.raster import BrotherQLRaster
-    from brother_ql.conversion import convert
-    from brother_ql.backends.helpers import send, discover
+def print_local_usb(image, label_size, copies=1, cut_every=1):
+    """Print to a locally connected USB Brother QL printer using brother_ql.
 
-    try:
-        # Discover local USB printers
-        with suppress_stderr():
-            printers = discover(backend_identifier='pyusb')
+    image may be a PIL image or a path. Copies go out as one multi-page job,
+    so the printer feeds them back to back instead of restarting per copy.
+    """
+    return print_local_usb_pages([image] * copies, label_size, cut_every)
 
-        if not printers:
-            with suppress_stderr():
-                printers = discover(backend_identifier='linux_kernel')
 
-        if not printers:
-            return False, "No local USB Brother QL printer found"
+# (identifier, backend) of the last local USB printer found by find_local_printer
+_local_printer = None
+
+
+def find_local_printer(refresh=False):
+    """Return (identifier, backend) of the first local USB Brother QL, or None.
+
+    USB enumeration is slow, so the result is cached until refresh=True.
+    """
+    global _local_printer
+    if _local_printer is None or refresh:
+        _local_printer = None
+        for backend in ('pyusb', 'linux_kernel'):
+            printers = discover(backend_identifier=backend)
+            if printers:
+                # brother_ql lists devices as {'identifier': ..., 'instance': ...}
+                printer = printers[0]
+                identifier = printer['identifier'] if isinstance(printer, dict) else printer
+                _local_printer = (identifier, backend)
+                break
+    return _local_printer
 
-        printer_id = printers[0]
-        backend = 'pyusb' if printer_id.startswith('usb://') else 'linux_kernel'
-
-        # Print copies
-        for _ in range(copies):
-            qlr = BrotherQLRaster(PRINTER_MODEL)
-            instructions = convert(
-                qlr=qlr,
-                images=[image_path],
-                label=str(label_size),
-                rotate=90,
-                threshold=70,
-                dither=False,
-                compress=False,
-                red=False,
-                cut=True,
-            )
-            with suppress_stderr():
-                send(
-                    instructions=instructions,
-                    printer_identifier=printer_id,
-                    backend_identifier=backend,
-                    blocking=True
-                )
 
-        return True, f"Printed {copies} label(s) to local USB printer"
+def open_local_printer(printer):
+    """Open the backend for a find_local_printer() result; raises if the device is gone"""
+    backend_class = backend_factory(printer[1])['backend_class']
+    return backend_class(printer[0])
+
+
+def write_and_wait(backend, instructions, timeout=10):
+    """Write a raster job to an open backend and wait for the printer to finish.
+
+    Mirrors the status polling of brother_ql's send(), but on a backend the
+    caller already opened, so the device is enumerated and claimed only once.
+
+    Returns:
+        list: errors reported by the printer (empty on success or no reply)
+    """
+    start = time.time()
+    backend.write(instructions)
+    did_print = ready = False
+    while time.time() - start < timeout:
+        data = backend.read()
+        if not data:
+            time.sleep(0.005)
+            continue
+        try:
+            result = interpret_response(data)
+        except ValueError:
+            continue
+        if result['errors']:
+            return result['errors']
+        if result['status_type'] == 'Printing completed':
+            did_print = True
+        if result['status_type'] == 'Phase change' and result['phase_type'] == 'Waiting to receive':
+            ready = True
+        if did_print and ready:
+            break
+    return []
+
+
+def print_local_usb_pages(images, label_size, cut_every=1):
+    """Print several labels to a local USB printer as one multi-page job.
+
+    Args:
+        images: PIL images (or image paths), one entry per printed label
+        label_size: Label width in mm
+        cut_every: Cut after every N labels (the last label is always cut)
+
+    Returns:
+        tuple: (success: bool, message: str)
+    """
+    try:
+        # One raster job and one backend connection for every page
+        instructions = convert_pages(images, label_size, cut_every=cut_every)
+
+        printer = find_local_printer()
+        if not printer:
+            return False, "No local USB Brother QL printer found"
+        try:
+            backend = open_local_printer(printer)
+        except Exception:
+            # The cached device may have been unplugged or renumbered; look again once.
+            # Nothing has been written yet, so this cannot print a label twice.
+            printer = find_local_printer(refresh=True)
+            if not printer:
+                return False, "No local USB Brother QL printer found"
+            backend = open_local_printer(printer)
+        try:
+            # Errors from here on may come after the job was written; never resend
+            errors = write_and_wait(backend, instructions)
+        finally:
+            backend.dispose()
+        if errors:
+            return False, f"Printer error: {', '.join(errors)}"
+
+        return True, f"Printed {len(images)} label(s) to local USB printer"
 
     except Exception as e:
         return False, f"Local print error: {str(e)}"
@@ -245,19 +318,326 @@ def print_via_ssh(image_path, host, label_size, copies=1):
 
 # Import constants from print_label.py
 from print_label import (
-    TAPE_WIDTHS, PRINTER_MODEL, DEFAULT_PRINTER, DEFAULT_BACKEND,
+    TAPE_WIDTHS, DEFAULT_PRINTER, DEFAULT_BACKEND,
     DEFAULT_FONT, BOX_ICON_PATH, create_label_image, create_text_only_label,
     create_label_image_template2, create_label_image_template3,
     create_vertical_text_label, create_horizontal_centered_label,
-    create_label_image_template6, create_shelf_label, create_storage_qr_label
+    create_label_image_template6, create_shelf_label, create_storage_qr_label,
+    convert_pages, render_template
 )
 
 
+def warmup_render_caches(tape_width_mm, font_path, font_size):
+    """Render a throwaway label so font/QR caches are warm before the first preview"""
+    try:
+        render_template_image(2, "https://example.com", "Box 1", tape_width_mm,
+                              font_path, font_size, True)
+    except Exception:
+        pass  # Best effort - real errors surface on the first user preview
+
+def render_batch_images(template, jobs, tape_width_mm, font_path, font_size,
+                        include_qr=True):
+    """Render (url, text) jobs for one template in parallel, preserving order"""
+    # Threads rather than a process pool: a batch is at most 10 labels of a few
+    # ms each, less than spawning workers and pickling the images back would
+    # cost, and threads share the font/QR/render caches
+    if not jobs:
+        return []
+
+    def render_one(job):
+        url, text = job
+        return render_template_image(
+            template, url, text, tape_width_mm, font_path, font_size, include_qr
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        return list(executor.map(render_one, jobs))
+
+
+def render_range_images(label_texts, vertical, tape_width_mm, font_path, font_size):
+    """Render Batch Range text labels in parallel, rotated for the vertical layout"""
+    # Both layouts render template 4; the vertical one is the same label turned
+    images = render_batch_images(
+        4, [("", text) for text in label_texts],
+        tape_width_mm, font_path, font_size, include_qr=False
+    )
+    if vertical:
+        # transpose returns new images; the cached renders are untouched
+        images = [img.transpose(Image.Transpose.ROTATE_90) for img in images]
+    return images
+
+
+def batch_range_texts(prefix, first_num, last_num):
+    """Label texts for a numbered range, e.g. "Box 1".."Box 5" (or bare numbers)"""
+    return [f"{prefix} {num}" if prefix else str(num)
+            for num in range(first_num, last_num + 1)]
+
+
+# Labels rendered and sent per local USB job when printing a Batch Range, so
+# memory stays bounded however long the range is
+RANGE_PRINT_CHUNK = 50
+
+# Labels shown in the Batch Range preview
+RANGE_PREVIEW_LIMIT = 20
+
+
+def print_range_chunk(label_texts, vertical, tape_width_mm, font_path, font_size,
+                      cut_every):
+    """Render one chunk of a Batch Range and print it as one local USB job"""
+    images = render_range_images(label_texts, vertical, tape_width_mm, font_path, font_size)
+    return print_local_usb_pages(images, tape_width_mm, cut_every)
+
+
+def print_range_label(text, vertical, tape_width_mm, font_path, font_size, printer_name):
+    """Render one Batch Range label and print it (auto-detects local USB vs network)"""
+    image, = render_range_images([text], vertical, tape_width_mm, font_path, font_size)
+    return print_label_image(image, printer_name, tape_width_mm, 1)
+
+
+def stack_images_vertically(images, gap=10):
+    """Stack images top to bottom on a white canvas with a gap between them"""
+    total_height = sum(img.height for img in images) + (len(images) - 1) * gap
+    max_width = max(img.width for img in images)
+
+    # paste() copies row by row in C straight into the canvas; joining
+    # tobytes() buffers measured ~3x slower because of the extra copies
+    combined = Image.new("L", (max_width, total_height), 255)
+    y_offset = 0
+    for img in images:
+        combined.paste(img, (0, y_offset))
+        y_offset += img.height + gap
+    return combined
+
+
+# PIL mode -> (QImage format, bytes per line for a given width) for modes Qt can wrap directly
+_QIMAGE_FORMATS = {
+    "1": (QImage.Format.Format_Mono, lambda width: (width + 7) // 8),
+    "L": (QImage.Format.Format_Grayscale8, lambda width: width),
+    "RGBA": (QImage.Format.Format_RGBA8888, lambda width: width * 4),
+}
+
+# PIL packs mode "1" with 0 = black and 1 = white, MSB first like Format_Mono
+_MONO_COLOR_TABLE = [qRgb(0, 0, 0), qRgb(255, 255, 255)]
+
+
+def pil_to_qpixmap(image):
+    """Convert a PIL image to a QPixmap in memory (no temp PNG round-trip)"""
+    if image.mode == "RGB":
+        # Labels are black on white, so a grayscale pixmap shows the same thing
+        # at a third of the RGB888 size
+        image = image.convert("L")
+    elif image.mode not in _QIMAGE_FORMATS:
+        image = image.convert("RGBA")
+    qformat, bytes_per_line = _QIMAGE_FORMATS[image.mode]
+    data = image.tobytes("raw", image.mode)
+    qimage = QImage(data, image.width, image.height,
+                    bytes_per_line(image.width), qformat)
+    if qformat == QImage.Format.Format_Mono:
+        qimage.setColorTable(_MONO_COLOR_TABLE)
+    # fromImage copies the pixels, so `data` only needs to outlive this call
+    return QPixmap.fromImage(qimage)
+
+
+# Shared combo box options as (display text, data) pairs, built once
+PREFIX_OPTIONS = [
+    ("None", ""),
+    ("Box", "Box"),
+    ("Container", "Container"),
+    ("Shelf", "Shelf"),
+    ("Asset", "Asset"),
+]
+TEMPLATE_OPTIONS = [
+    ("Template 1 (Horizontal)", 1),
+    ("Template 2 (QR Above Text)", 2),
+    ("Template 3 (Rotated Text)", 3),
+    ("Template 4 (Text Only)", 4),
+    ("Template 5 (Text Rotated 90° CCW)", 5),
+    ("Template 6 (Text Above QR)", 6),
+    ("Template 7 (Shelf Label)", 7),
+    ("Template 8 (Storage QR Label)", 8),
+]
+TAPE_WIDTH_OPTIONS = [(f"{width}mm", width) for width in sorted(TAPE_WIDTHS)]
+
+# Recommended DK continuous tapes shown on the About tab: (width, product code, description)
+TAPE_SPECS = [
+    ("29mm", "DK-22210", "Continuous Length Paper (White)"),
+    ("38mm", "DK-22225", "Continuous Length Paper (White)"),
+    ("50mm", "DK-22223", "Continuous Length Paper (White)"),
+    ("62mm", "DK-22205", "Continuous Length Paper (White)"),
+]
+
+# Text Only tab layouts -> equivalent render_template_image template numbers
+TEXT_ONLY_TEMPLATES = {"horizontal": 4, "vertical": 5}
+
+
+def populate_combo(combo, options):
+    """Fill a QComboBox from a list of (display text, data) pairs"""
+    for text, data in options:
+        combo.addItem(text, data)
+
+_TRAILING_NUM_RE = re.compile(r"(\d+)$")
+
+
+def _increment_trailing_number(text):
+    """Return text with its trailing number incremented ('Box 9' -> 'Box 10'), or None"""
+    match = _TRAILING_NUM_RE.search(text)
+    if not match:
+        return None
+    return text[:match.start()] + str(int(match.group(1)) + 1)
+
+@lru_cache(maxsize=256)
+def _final_text(prefix, text):
+    """Join an optional prefix and label text ('Box' + '12' -> 'Box 12')"""
+    text = text.strip()
+    if prefix and text:
+        return f"{prefix} {text}"
+    return text
+
+@lru_cache(maxsize=64)
+def _render_cached(template, qr_data, text, tape_width_mm, font_path, font_size,
+                   include_qr, font_mtime):
+    """Render a label for the given template (memoized - do not mutate the result)"""
+    return render_template(
+        template, qr_data, text, tape_width_mm, font_path, font_size, include_qr
+    )
+
+
+def font_file_mtime(font_path):
+    """Modification time of a font file for cache keys (None if unreadable)"""
+    try:
+        return os.path.getmtime(font_path)
+    except OSError:
+        return None
+
+
+def render_template_image(template, qr_data, text, tape_width_mm, font_path,
+                          font_size, include_qr):
+    """Render a label image, reusing a cached result for identical inputs"""
+    return _render_cached(
+        template, qr_data if include_qr else "", text, tape_width_mm,
+        font_path, font_size, include_qr, font_file_mtime(font_path)
+    )
+
+
+class RenderSignals(QObject):
+    """Signals emitted by RenderWorker (QRunnable cannot emit signals itself)"""
+    finished = pyqtSignal(int, object)  # token, PIL image
+    failed = pyqtSignal(int, str)  # token, error message
+
+
+class RenderWorker(QRunnable):
+    """Render a label image on a QThreadPool thread"""
+
+    def __init__(self, token, render_func, *args):
+        super().__init__()
+        self.token = token
+        self.render_func = render_func
+        self.args = args
+        self.signals = RenderSignals()
+
+    def run(self):
+        try:
+            image = self.render_func(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(self.token, str(e))
+        else:
+            self.signals.finished.emit(self.token, image)
+
+
+class PrintSignals(QObject):
+    """Signals emitted by PrintWorker"""
+    progress = pyqtSignal(str)  # status bar message
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class PrintWorker(QRunnable):
+    """Run print steps in order on a pool thread so the UI stays responsive
+
+    steps is a list of (status message, print function, args) tuples; each
+    print function returns (success, message) like print_label_image.
+    """
+
+    def __init__(self, steps):
+        super().__init__()
+        self.steps = steps
+        self.signals = PrintSignals()
+
+    def run(self):
+        for status, print_func, args in self.steps:
+            self.signals.progress.emit(status)
+            try:
+                success, message = print_func(*args)
+            except Exception as e:
+                success, message = False, str(e)
+            if not success:
+                self.signals.finished.emit(False, message)
+                return
+        self.signals.finished.emit(True, "")
+
+
+class PreviewLabel(QLabel):
+    """QLabel that shows a pixmap scaled down to its width, rescaling only on real size changes"""
+
+    def __init__(self, text=""):
+        super().__init__(text)
+        self._source_pixmap = None  # Full-resolution pixmap passed to setPixmap
+        self._scaled_pixmap = (0, None)  # (display width, scaled copy) for the last width shown
+        self._applied_width = 0
+        # Follow the scroll area's width instead of growing to the pixmap width
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        # Coalesce the resize events of a window drag into one rescale
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.timeout.connect(self._apply_scaled_pixmap)
+
+    def setPixmap(self, pixmap):
+        if pixmap is None or pixmap.isNull():
+            self.clear_pixmap()
+            return
+        self._source_pixmap = pixmap
+        self._scaled_pixmap = (0, None)
+        self._apply_scaled_pixmap()
+
+    def clear_pixmap(self):
+        """Drop the pixmap (QLabel.clear, so no null QPixmap is built); callers set the text after"""
+        self._source_pixmap = None
+        self._scaled_pixmap = (0, None)
+        self.clear()
+
+    def has_pixmap(self):
+        """Whether a non-null pixmap is shown (without copying it out of Qt)"""
+        return self._source_pixmap is not None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._source_pixmap is None:
+            return
+        # Rescale at once if the pixmap would be clipped, but only grow it
+        # again after a change of more than 5%
+        target_w = self.contentsRect().width()
+        if target_w < self._applied_width or target_w > self._applied_width * 1.05:
+            self._rescale_timer.start(50)
+
+    def _apply_scaled_pixmap(self):
+        if self._source_pixmap is None:
+            return
+        target_w = self.contentsRect().width()
+        self._applied_width = target_w
+        if target_w <= 0 or self._source_pixmap.width() <= target_w:
+            super().setPixmap(self._source_pixmap)
+            return
+        if self._scaled_pixmap[0] != target_w:
+            self._scaled_pixmap = (target_w, self._source_pixmap.scaledToWidth(
+                target_w, Qt.TransformationMode.SmoothTransformation
+            ))
+        super().setPixmap(self._scaled_pixmap[1])
+
+
 class SettingsDialog(QDialog):
     """Dialog for printer settings (printer selection, paper size, font)"""
 
     def __init__(self, parent, tape_width, font_size, font_path,
-                 printer_name=None):
+                 printer_name=None, cut_every=1):
         super().__init__(parent)
         self.setWindowTitle("Printer Settings")
         self.setModal(True)
@@ -286,8 +666,7 @@ class SettingsDialog(QDialog):
 
         # Paper size dropdown
         self.tape_width_combo = QComboBox()
-        for width in sorted(TAPE_WIDTHS.keys()):
-            self.tape_width_combo.addItem(f"{width}mm", width)
+        populate_combo(self.tape_width_combo, TAPE_WIDTH_OPTIONS)
         index = self.tape_width_combo.findData(tape_width)
         if index >= 0:
             self.tape_width_combo.setCurrentIndex(index)
@@ -310,6 +689,18 @@ class SettingsDialog(QDialog):
         font_layout.addWidget(browse_btn)
         form_layout.addRow("Font:", font_layout)
 
+        # Auto-cut interval for multi-label jobs (copies, batches)
+        self.cut_every_spin = QSpinBox()
+        self.cut_every_spin.setRange(1, 255)
+        self.cut_every_spin.setValue(cut_every)
+        self.cut_every_spin.setPrefix("every ")
+        self.cut_every_spin.setSuffix(" label(s)")
+        self.cut_every_spin.setToolTip(
+            "Cut after every N labels when printing several at once (USB printers).\n"
+            "The last label is always cut."
+        )
+        form_layout.addRow("Cut:", self.cut_every_spin)
+
         layout.addLayout(form_layout)
 
         # OK/Cancel buttons
@@ -359,6 +750,7 @@ class SettingsDialog(QDialog):
             'font_size': self.font_size_spin.value(),
             'font_path': self.font_path,
             'printer_name': self.printer_combo.currentData() or "",
+            'cut_every': self.cut_every_spin.value(),
         }
 
 
@@ -378,15 +770,49 @@ class LabelPrinterGUI(QMainWindow):
         self.font_size = 100
         self.font_path = DEFAULT_FONT
         self.printer_name = ""  # CUPS printer name
+        self.cut_every = 1  # Auto-cut after every N labels of a multi-label job
+        self._preview_generation = 0  # Bumped per request so stale renders are dropped
+        self._preview_interactive = True  # Whether the in-flight preview reports errors in a dialog
+        self._preview_pixmap_key = ""  # QPixmapCache key of the pending preview
+        self._text_only_pixmap_key = ""  # QPixmapCache key of the shown text-only preview
+        # Print jobs run one at a time, off the GUI thread
+        self._print_pool = QThreadPool(self)
+        self._print_pool.setMaxThreadCount(1)
+        self._print_worker = None
+        self._print_button_states = {}
         self.init_ui()
         self.load_settings()
         self.setup_shortcuts()
+        # Warm the renderer's caches in the background before the first preview
+        tape_width, font_path, font_size = self.tape_width, self.font_path, self.font_size
+        QThreadPool.globalInstance().start(
+            lambda: warmup_render_caches(tape_width, font_path, font_size)
+        )
 
     def init_ui(self):
         self.setWindowTitle("Brother Label Printer")
         self.setMinimumWidth(900)
         self.setMinimumHeight(700)
 
+        # Debounce live preview so a burst of keystrokes renders only once
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self.auto_preview)
+        self._text_only_preview_timer = QTimer(self)
+        self._text_only_preview_timer.setSingleShot(True)
+        self._text_only_preview_timer.timeout.connect(self.auto_text_only_preview)
+
+        # Coalesce the widget updates (pixmap clear, validation stylesheets)
+        # that follow each keystroke; cached-image invalidation stays immediate
+        self._invalidate_timer = QTimer(self)
+        self._invalidate_timer.setSingleShot(True)
+        self._invalidate_timer.setInterval(80)
+        self._invalidate_timer.timeout.connect(self._do_invalidate)
+        self._text_only_invalidate_timer = QTimer(self)
+        self._text_only_invalidate_timer.setSingleShot(True)
+        self._text_only_invalidate_timer.setInterval(80)
+        self._text_only_invalidate_timer.timeout.connect(self._do_text_only_invalidate)
+
         # Main widget and layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -396,35 +822,23 @@ class LabelPrinterGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # Create QR + Text tab
+        # Create QR + Text tab (built eagerly - it is the start tab)
         qr_text_tab = QWidget()
         self.init_single_tab(qr_text_tab)
         self.tab_widget.addTab(qr_text_tab, "QR + Text")
 
-        # Create batch mode tab
-        batch_tab = QWidget()
-        self.init_batch_tab(batch_tab)
-        self.tab_widget.addTab(batch_tab, "Batch Mode")
-
-        # Create text only tab
-        text_only_tab = QWidget()
-        self.init_text_only_tab(text_only_tab)
-        self.tab_widget.addTab(text_only_tab, "Text Only")
-
-        # Create batch range tab
-        batch_range_tab = QWidget()
-        self.init_batch_range_tab(batch_range_tab)
-        self.tab_widget.addTab(batch_range_tab, "Batch Range")
-
-        # Create templates tab
-        templates_tab = QWidget()
-        self.init_templates_tab(templates_tab)
-        self.tab_widget.addTab(templates_tab, "Templates")
-
-        # Create about tab
-        about_tab = QWidget()
-        self.init_about_tab(about_tab)
-        self.tab_widget.addTab(about_tab, "About")
+        # Remaining tabs are placeholders built on first visit (see ensure_tab_built)
+        self._tab_builders = {}
+        self._built_tabs = {0}
+        for builder, title in (
+            (self.init_batch_tab, "Batch Mode"),
+            (self.init_text_only_tab, "Text Only"),
+            (self.init_batch_range_tab, "Batch Range"),
+            (self.init_templates_tab, "Templates"),
+            (self.init_about_tab, "About"),
+        ):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
 
         # Menu bar
         menubar = self.menuBar()
@@ -474,11 +888,7 @@ class LabelPrinterGUI(QMainWindow):
         prefix_label.setMinimumWidth(50)
         prefix_layout.addWidget(prefix_label)
         self.prefix_combo = QComboBox()
-        self.prefix_combo.addItem("None", "")
-        self.prefix_combo.addItem("Box", "Box")
-        self.prefix_combo.addItem("Container", "Container")
-        self.prefix_combo.addItem("Shelf", "Shelf")
-        self.prefix_combo.addItem("Asset", "Asset")
+        populate_combo(self.prefix_combo, PREFIX_OPTIONS)
         self.prefix_combo.setToolTip("Select a prefix to add before the label number")
         self.prefix_combo.currentIndexChanged.connect(self.on_prefix_changed)
         prefix_layout.addWidget(self.prefix_combo)
@@ -526,14 +936,7 @@ class LabelPrinterGUI(QMainWindow):
         template_layout.addWidget(QLabel("Template:"))
         self.template_combo = QComboBox()
         self.template_combo.setToolTip("Label template layout")
-        self.template_combo.addItem("Template 1 (Horizontal)", 1)
-        self.template_combo.addItem("Template 2 (QR Above Text)", 2)
-        self.template_combo.addItem("Template 3 (Rotated Text)", 3)
-        self.template_combo.addItem("Template 4 (Text Only)", 4)
-        self.template_combo.addItem("Template 5 (Text Rotated 90° CCW)", 5)
-        self.template_combo.addItem("Template 6 (Text Above QR)", 6)
-        self.template_combo.addItem("Template 7 (Shelf Label)", 7)
-        self.template_combo.addItem("Template 8 (Storage QR Label)", 8)
+        populate_combo(self.template_combo, TEMPLATE_OPTIONS)
         self.template_combo.currentIndexChanged.connect(self.on_input_changed)
         template_layout.addWidget(self.template_combo)
         template_layout.addStretch()
@@ -558,7 +961,7 @@ class LabelPrinterGUI(QMainWindow):
         button_layout = QHBoxLayout()
 
         self.preview_button = QPushButton("Generate Preview")
-        self.preview_button.clicked.connect(self.generate_preview)
+        self.preview_button.clicked.connect(lambda: self.generate_preview())
         self.preview_button.setFont(QFont("Sans", 11, QFont.Weight.Bold))
         self.preview_button.setToolTip("Generate preview image (Enter)")
         button_layout.addWidget(self.preview_button)
@@ -580,7 +983,7 @@ class LabelPrinterGUI(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setMinimumHeight(200)
 
-        self.preview_label = QLabel("Generate a preview to see your label")
+        self.preview_label = PreviewLabel("Generate a preview to see your label")
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 20px; }")
 
@@ -603,14 +1006,7 @@ class LabelPrinterGUI(QMainWindow):
         template_layout.addWidget(QLabel("Template:"))
         self.batch_template_combo = QComboBox()
         self.batch_template_combo.setToolTip("Label template layout (applies to all labels)")
-        self.batch_template_combo.addItem("Template 1 (Horizontal)", 1)
-        self.batch_template_combo.addItem("Template 2 (QR Above Text)", 2)
-        self.batch_template_combo.addItem("Template 3 (Rotated Text)", 3)
-        self.batch_template_combo.addItem("Template 4 (Text Only)", 4)
-        self.batch_template_combo.addItem("Template 5 (Text Rotated 90° CCW)", 5)
-        self.batch_template_combo.addItem("Template 6 (Text Above QR)", 6)
-        self.batch_template_combo.addItem("Template 7 (Shelf Label)", 7)
-        self.batch_template_combo.addItem("Template 8 (Storage QR Label)", 8)
+        populate_combo(self.batch_template_combo, TEMPLATE_OPTIONS)
         template_layout.addWidget(self.batch_template_combo)
         template_layout.addStretch()
         settings_layout.addLayout(template_layout)
@@ -619,11 +1015,7 @@ class LabelPrinterGUI(QMainWindow):
         prefix_layout = QHBoxLayout()
         prefix_layout.addWidget(QLabel("Prefix:"))
         self.batch_prefix_combo = QComboBox()
-        self.batch_prefix_combo.addItem("None", "")
-        self.batch_prefix_combo.addItem("Box", "Box")
-        self.batch_prefix_combo.addItem("Container", "Container")
-        self.batch_prefix_combo.addItem("Shelf", "Shelf")
-        self.batch_prefix_combo.addItem("Asset", "Asset")
+        populate_combo(self.batch_prefix_combo, PREFIX_OPTIONS)
         self.batch_prefix_combo.setToolTip("Select a prefix to add before label text/numbers (applies to all labels)")
         self.batch_prefix_combo.currentIndexChanged.connect(self.save_settings)
         prefix_layout.addWidget(self.batch_prefix_combo)
@@ -696,7 +1088,7 @@ class LabelPrinterGUI(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setMinimumHeight(200)
 
-        self.batch_preview_label = QLabel("Add labels and click 'Preview All Labels' to see your batch")
+        self.batch_preview_label = PreviewLabel("Add labels and click 'Preview All Labels' to see your batch")
         self.batch_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.batch_preview_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 20px; }")
 
@@ -720,11 +1112,7 @@ class LabelPrinterGUI(QMainWindow):
         prefix_label.setMinimumWidth(50)
         prefix_layout.addWidget(prefix_label)
         self.text_only_prefix_combo = QComboBox()
-        self.text_only_prefix_combo.addItem("None", "")
-        self.text_only_prefix_combo.addItem("Box", "Box")
-        self.text_only_prefix_combo.addItem("Container", "Container")
-        self.text_only_prefix_combo.addItem("Shelf", "Shelf")
-        self.text_only_prefix_combo.addItem("Asset", "Asset")
+        populate_combo(self.text_only_prefix_combo, PREFIX_OPTIONS)
         self.text_only_prefix_combo.setToolTip("Select a prefix to add before the label number")
         self.text_only_prefix_combo.currentIndexChanged.connect(self.on_text_only_prefix_changed)
         prefix_layout.addWidget(self.text_only_prefix_combo)
@@ -822,7 +1210,7 @@ class LabelPrinterGUI(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setMinimumHeight(200)
 
-        self.text_only_preview_label = QLabel("Generate a preview to see your label")
+        self.text_only_preview_label = PreviewLabel("Generate a preview to see your label")
         self.text_only_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.text_only_preview_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 20px; }")
 
@@ -839,44 +1227,58 @@ class LabelPrinterGUI(QMainWindow):
         self.font_size = self.settings.value("font_size", 100, type=int)
         self.font_path = self.settings.value("font_path", DEFAULT_FONT)
         self.printer_name = self.settings.value("printer_name", "")
+        self.cut_every = self.settings.value("cut_every", 1, type=int)
 
-        # Prefix (QR+Text tab)
-        prefix = self.settings.value("prefix", "")
-        index = self.prefix_combo.findData(prefix)
-        if index >= 0:
-            self.prefix_combo.setCurrentIndex(index)
-
-        # Prefix (Text-only tab)
-        text_only_prefix = self.settings.value("text_only_prefix", "")
-        index = self.text_only_prefix_combo.findData(text_only_prefix)
-        if index >= 0:
-            self.text_only_prefix_combo.setCurrentIndex(index)
-
-        # Prefix (Batch mode tab)
-        batch_prefix = self.settings.value("batch_prefix", "")
-        index = self.batch_prefix_combo.findData(batch_prefix)
-        if index >= 0:
-            self.batch_prefix_combo.setCurrentIndex(index)
+        # Prefix (QR+Text tab); the other tabs restore theirs when first built
+        self.restore_prefix_combo(self.prefix_combo, "prefix")
+        self.update_prefix_placeholders()
 
         # Load skip confirmation preference
         self.skip_print_confirmation = self.settings.value("skip_print_confirmation", False, type=bool)
 
+    def restore_prefix_combo(self, combo, key):
+        """Select the saved prefix in combo without firing its change handler"""
+        # Signals are blocked so loading does not trigger preview clears/renders
+        # or a save_settings round-trip
+        with QSignalBlocker(combo):
+            index = combo.findData(self.settings.value(key, ""))
+            if index >= 0:
+                combo.setCurrentIndex(index)
+
+    def ensure_tab_built(self, index):
+        """Build a lazily-created tab the first time it is shown"""
+        if index in self._built_tabs or index not in self._tab_builders:
+            return
+        self._built_tabs.add(index)
+        self._tab_builders[index](self.tab_widget.widget(index))
+
+        # Apply saved settings for the tab's widgets
+        if index == 1:
+            self.restore_prefix_combo(self.batch_prefix_combo, "batch_prefix")
+        elif index == 2:
+            self.restore_prefix_combo(self.text_only_prefix_combo, "text_only_prefix")
+            self.update_text_only_prefix_placeholders()
+
     def save_settings(self):
         """Save persistent settings"""
         self.settings.setValue("tape_width", self.tape_width)
         self.settings.setValue("font_size", self.font_size)
         self.settings.setValue("font_path", self.font_path)
         self.settings.setValue("printer_name", self.printer_name)
+        self.settings.setValue("cut_every", self.cut_every)
         self.settings.setValue("prefix", self.prefix_combo.currentData())
-        self.settings.setValue("text_only_prefix", self.text_only_prefix_combo.currentData())
-        self.settings.setValue("batch_prefix", self.batch_prefix_combo.currentData())
+        # Tabs that were never opened keep their stored prefix
+        if hasattr(self, 'text_only_prefix_combo'):
+            self.settings.setValue("text_only_prefix", self.text_only_prefix_combo.currentData())
+        if hasattr(self, 'batch_prefix_combo'):
+            self.settings.setValue("batch_prefix", self.batch_prefix_combo.currentData())
         self.settings.setValue("skip_print_confirmation", self.skip_print_confirmation)
 
     def open_settings(self):
         """Open the printer settings dialog"""
         dialog = SettingsDialog(
             self, self.tape_width, self.font_size, self.font_path,
-            self.printer_name
+            self.printer_name, self.cut_every
         )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             values = dialog.get_values()
@@ -884,14 +1286,24 @@ class LabelPrinterGUI(QMainWindow):
             self.font_size = values['font_size']
             self.font_path = values['font_path']
             self.printer_name = values['printer_name']
+            self.cut_every = values['cut_every']
             self.save_settings()
             printer_msg = f", printer: {self.printer_name}" if self.printer_name else ""
             self.statusBar().showMessage(
                 f"Settings updated: {self.tape_width}mm tape, {self.font_size}pt font{printer_msg}", 3000
             )
 
-    def generate_preview(self):
-        """Generate preview image"""
+    def generate_preview(self, interactive=True):
+        """Generate preview image
+
+        interactive=False is the debounced auto-preview while typing: settings
+        are not saved and errors go to the status bar instead of a dialog.
+        """
+        # Apply any pending invalidation now so it cannot clear the new preview
+        if self._invalidate_timer.isActive():
+            self._invalidate_timer.stop()
+            self._do_invalidate()
+
         url = self.url_input.text().strip()
         label = self.label_input.text().strip()
         include_qr = self.include_qr_checkbox.isChecked()
@@ -916,8 +1328,9 @@ class LabelPrinterGUI(QMainWindow):
         try:
             self.statusBar().showMessage("Generating preview...")
 
-            # Save settings
-            self.save_settings()
+            # Save settings (not on every auto-preview keystroke)
+            if interactive:
+                self.save_settings()
 
             # Get final label text with prefix
             final_label = self.get_final_label_text()
@@ -925,124 +1338,82 @@ class LabelPrinterGUI(QMainWindow):
             # Get selected template
             template = self.template_combo.currentData()
 
-            # Generate image based on template selection
-            if template == 1:
-                self.preview_image = create_label_image(
-                    qr_data=url if include_qr else "",
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size,
-                    include_qr=include_qr
-                )
-            elif template == 2:
-                self.preview_image = create_label_image_template2(
-                    qr_data=url if include_qr else "",
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size,
-                    include_qr=include_qr
-                )
-            elif template == 3:
-                self.preview_image = create_label_image_template3(
-                    qr_data=url if include_qr else "",
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size,
-                    include_qr=include_qr
-                )
-            elif template == 4:
-                self.preview_image = create_text_only_label(
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size
-                )
-            elif template == 5:
-                self.preview_image = create_vertical_text_label(
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path
-                )
-            elif template == 6:
-                self.preview_image = create_label_image_template6(
-                    qr_data=url if include_qr else "",
-                    text=final_label,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size,
-                    include_qr=include_qr
-                )
-            elif template == 7:
-                # Shelf label: split text into label and number
-                # Format: "SHELF 2" -> label_text="SHELF", number="2"
-                parts = final_label.rsplit(' ', 1)
-                if len(parts) == 2:
-                    label_text, number = parts
-                else:
-                    # If no space, use entire text as label and empty number
-                    label_text = final_label
-                    number = ""
-                self.preview_image = create_shelf_label(
-                    label_text=label_text,
-                    number=number,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path
-                )
-            elif template == 8:
-                # Storage QR label: QR code with storage type below and large number on right
-                # Format: "BOX 2" -> storage_type="BOX", number="2"
-                parts = final_label.rsplit(' ', 1)
-                if len(parts) == 2:
-                    storage_type, number = parts
-                else:
-                    storage_type = final_label
-                    number = ""
-                self.preview_image = create_storage_qr_label(
-                    qr_data=url if include_qr else "",
-                    storage_type=storage_type,
-                    number=number,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    include_qr=include_qr
-                )
+            # Key for reusing the converted QPixmap of an identical preview
+            self._preview_pixmap_key = "preview:{}".format(hash((
+                template, url if include_qr else "", final_label, self.tape_width,
+                self.font_path, font_file_mtime(self.font_path), self.font_size, include_qr
+            )))
+
+            # Render off the GUI thread; on_preview_rendered displays the result
+            self._preview_generation += 1
+            self._preview_interactive = interactive
+            worker = RenderWorker(
+                self._preview_generation, render_template_image,
+                template, url, final_label, self.tape_width,
+                self.font_path, self.font_size, include_qr
+            )
+            worker.signals.finished.connect(self.on_preview_rendered)
+            worker.signals.failed.connect(self.on_preview_failed)
+            QThreadPool.globalInstance().start(worker)
 
-            # Save to temp file and display
-            temp_path = "/tmp/brother_ql_preview.png"
-            self.preview_image.save(temp_path)
+        except Exception as e:
+            self.report_preview_error(str(e), interactive)
 
-            # Load and display preview
-            pixmap = QPixmap(temp_path)
-            self.preview_label.setPixmap(pixmap)
-            self.preview_label.setScaledContents(False)
+    def report_preview_error(self, message, interactive):
+        """Show a preview error in a dialog, or only in the status bar for auto-previews"""
+        if not interactive:
+            self.statusBar().showMessage(f"Preview failed: {message}")
+            return
+        QMessageBox.critical(
+            self,
+            "Preview Error",
+            f"Failed to generate preview:\n{message}"
+        )
+        self.statusBar().showMessage("Preview failed")
 
-            # Enable print button
-            self.print_button.setEnabled(True)
+    def on_preview_rendered(self, token, image):
+        """Display a preview rendered by RenderWorker"""
+        if token != self._preview_generation:
+            return  # Inputs changed while rendering
 
-            tape_width = self.tape_width
-            label_type = "with QR code" if include_qr else "text-only"
-            self.statusBar().showMessage(
-                f"Preview generated ({label_type}): {self.preview_image.size[0]}x{self.preview_image.size[1]}px "
-                f"({tape_width}mm tape)"
-            )
+        self.preview_image = image
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Preview Error",
-                f"Failed to generate preview:\n{str(e)}"
-            )
-            self.statusBar().showMessage("Preview failed")
+        # Convert and display preview (reusing the cached pixmap when possible)
+        pixmap = QPixmapCache.find(self._preview_pixmap_key)
+        if pixmap is None:
+            pixmap = pil_to_qpixmap(self.preview_image)
+            QPixmapCache.insert(self._preview_pixmap_key, pixmap)
+        self.preview_label.setPixmap(pixmap)
+        self.preview_label.setScaledContents(False)
+
+        # Enable print button
+        self.print_button.setEnabled(True)
+
+        tape_width = self.tape_width
+        include_qr = self.include_qr_checkbox.isChecked()
+        label_type = "with QR code" if include_qr else "text-only"
+        self.statusBar().showMessage(
+            f"Preview generated ({label_type}): {self.preview_image.size[0]}x{self.preview_image.size[1]}px "
+            f"({tape_width}mm tape)"
+        )
+
+    def on_preview_failed(self, token, message):
+        """Report a preview render error from RenderWorker"""
+        if token != self._preview_generation:
+            return
+        self.report_preview_error(message, self._preview_interactive)
 
     def print_label(self):
         """Print the label"""
+        # Read widget/settings state once for the whole print
+        include_qr = self.include_qr_checkbox.isChecked()
+        tape_width = self.tape_width
+        printer_name = self.printer_name
+
         # If no preview, generate it first
         if not self.preview_image:
             url = self.url_input.text().strip()
             label = self.label_input.text().strip()
-            include_qr = self.include_qr_checkbox.isChecked()
 
             # Validate required fields
             if not label:
@@ -1069,85 +1440,10 @@ class LabelPrinterGUI(QMainWindow):
                 template = self.template_combo.currentData()
 
                 # Generate image without preview based on template selection
-                if template == 1:
-                    self.preview_image = create_label_image(
-                        qr_data=url if include_qr else "",
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size,
-                        include_qr=include_qr
-                    )
-                elif template == 2:
-                    self.preview_image = create_label_image_template2(
-                        qr_data=url if include_qr else "",
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size,
-                        include_qr=include_qr
-                    )
-                elif template == 3:
-                    self.preview_image = create_label_image_template3(
-                        qr_data=url if include_qr else "",
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size,
-                        include_qr=include_qr
-                    )
-                elif template == 4:
-                    self.preview_image = create_text_only_label(
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size
-                    )
-                elif template == 5:
-                    self.preview_image = create_vertical_text_label(
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path
-                    )
-                elif template == 6:
-                    self.preview_image = create_label_image_template6(
-                        qr_data=url if include_qr else "",
-                        text=final_label,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size,
-                        include_qr=include_qr
-                    )
-                elif template == 7:
-                    # Shelf label: split text into label and number
-                    parts = final_label.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        label_text, number = parts
-                    else:
-                        label_text = final_label
-                        number = ""
-                    self.preview_image = create_shelf_label(
-                        label_text=label_text,
-                        number=number,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path
-                    )
-                elif template == 8:
-                    # Storage QR label: QR code with storage type below and large number on right
-                    parts = final_label.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        storage_type, number = parts
-                    else:
-                        storage_type = final_label
-                        number = ""
-                    self.preview_image = create_storage_qr_label(
-                        qr_data=url if include_qr else "",
-                        storage_type=storage_type,
-                        number=number,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        include_qr=include_qr
-                    )
+                self.preview_image = render_template_image(
+                    template, url, final_label, tape_width,
+                    self.font_path, self.font_size, include_qr
+                )
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -1157,52 +1453,90 @@ class LabelPrinterGUI(QMainWindow):
                 return
 
         copies = self.get_copies()
-        include_qr = self.include_qr_checkbox.isChecked()
         label_type = "label with QR code" if include_qr else "text-only label"
 
         reply = QMessageBox.question(
             self,
             "Confirm Print",
-            f"Print {copies} {label_type}{'s' if copies > 1 else ''} on {self.tape_width}mm tape?",
+            f"Print {copies} {label_type}{'s' if copies > 1 else ''} on {tape_width}mm tape?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Save to temp file
-            temp_path = "/tmp/brother_ql_print.png"
-            self.preview_image.save(temp_path)
-
-            self.statusBar().showMessage(f"Sending {copies} label(s) to printer...")
-
             # Print label (auto-detects local USB vs network printer)
-            success, message = print_label_image(temp_path, self.printer_name, self.tape_width, copies)
+            self.start_print_job(
+                [(f"Sending {copies} label(s) to printer...", print_label_image,
+                  (self.preview_image, printer_name, tape_width, copies, self.cut_every))],
+                f"Print complete! {copies} label{'s' if copies > 1 else ''} sent.",
+                f"{copies} label{'s' if copies > 1 else ''} sent to {printer_name}!"
+            )
 
-            if success:
-                self.statusBar().showMessage(f"Print complete! {copies} label{'s' if copies > 1 else ''} sent.")
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"{copies} label{'s' if copies > 1 else ''} sent to {self.printer_name}!"
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Print Error",
-                    message
-                )
-                self.statusBar().showMessage("Print failed")
+    def print_buttons(self):
+        """Return the print buttons of every tab built so far"""
+        names = ("print_button", "batch_print_button",
+                 "text_only_print_button", "batch_range_print_button")
+        return [getattr(self, name) for name in names if hasattr(self, name)]
+
+    def start_print_job(self, steps, success_status, success_text,
+                        error_prefix="", failed_status="Print failed"):
+        """Run print steps on the print pool, reporting the outcome when done"""
+        # Disable printing until this job finishes
+        self._print_button_states = {button: button.isEnabled() for button in self.print_buttons()}
+        for button in self._print_button_states:
+            button.setEnabled(False)
+
+        worker = PrintWorker(steps)
+        worker.signals.progress.connect(self.statusBar().showMessage)
+        worker.signals.finished.connect(
+            lambda success, message: self.on_print_finished(
+                success, message, success_status, success_text, error_prefix, failed_status
+            )
+        )
+        self._print_worker = worker  # Keep the signals object alive until finished
+        self._print_pool.start(worker)
+
+    def on_print_finished(self, success, message, success_status, success_text,
+                          error_prefix, failed_status):
+        """Restore the print buttons and report the result of a print job"""
+        self._print_worker = None
+        for button, enabled in self._print_button_states.items():
+            button.setEnabled(enabled)
+        self._print_button_states = {}
+
+        if success:
+            self.statusBar().showMessage(success_status)
+            QMessageBox.information(self, "Success", success_text)
+        else:
+            QMessageBox.critical(self, "Print Error", f"{error_prefix}{message}")
+            self.statusBar().showMessage(failed_status)
 
     def on_input_changed(self):
         """Handle any input field changes - clear cached preview and validate"""
         # Clear cached preview so next print regenerates from current inputs
         self.preview_image = None
+        self._preview_generation += 1  # Discard any in-flight render
+        self._invalidate_timer.start()
+        self._preview_timer.start(150)
+
+    def _do_invalidate(self):
+        """Mark the preview display outdated and re-validate (debounced)"""
         # Also clear the preview display to show it's outdated
-        if self.preview_label.pixmap() and not self.preview_label.pixmap().isNull():
-            self.preview_label.setPixmap(QPixmap())
+        if self.preview_label.has_pixmap():
+            self.preview_label.clear_pixmap()
             self.preview_label.setText("Preview cleared - generate new preview or print directly")
             self.statusBar().showMessage("Inputs changed - preview cleared")
         self.validate_inputs()
 
+    def auto_preview(self):
+        """Regenerate the preview after input settles (silently skips incomplete input)"""
+        if self.tab_widget.currentIndex() != 0:
+            return
+        if not self.label_input.text().strip():
+            return
+        if self.include_qr_checkbox.isChecked() and not self.url_input.text().strip():
+            return
+        self.generate_preview(interactive=False)
+
     def on_qr_checkbox_changed(self, state):
         """Handle QR code checkbox state changes"""
         include_qr = self.include_qr_checkbox.isChecked()
@@ -1221,6 +1555,13 @@ class LabelPrinterGUI(QMainWindow):
 
     def on_prefix_changed(self):
         """Handle prefix selection changes"""
+        self.update_prefix_placeholders()
+
+        # Clear cached preview since prefix changed
+        self.on_input_changed()
+
+    def update_prefix_placeholders(self):
+        """Update label field caption and placeholder for the selected prefix"""
         prefix = self.prefix_combo.currentData()
 
         # Update label field placeholder and label based on prefix selection
@@ -1233,11 +1574,15 @@ class LabelPrinterGUI(QMainWindow):
             self.label_input.setPlaceholderText("Box 1")
             self.label_input.setToolTip("Text to display on the label")
 
-        # Clear cached preview since prefix changed
-        self.on_input_changed()
-
     def on_text_only_prefix_changed(self):
         """Handle text-only prefix selection changes"""
+        self.update_text_only_prefix_placeholders()
+
+        # Clear cached preview
+        self.on_text_only_input_changed()
+
+    def update_text_only_prefix_placeholders(self):
+        """Update text-only field caption and placeholder for the selected prefix"""
         prefix = self.text_only_prefix_combo.currentData()
 
         # Update label field placeholder and label based on prefix selection
@@ -1250,26 +1595,13 @@ class LabelPrinterGUI(QMainWindow):
             self.text_only_input.setPlaceholderText("Enter label text")
             self.text_only_input.setToolTip("Text to display on the label (centered)")
 
-        # Clear cached preview
-        self.on_text_only_input_changed()
-
     def get_final_label_text(self):
         """Get the final label text combining prefix and input"""
-        prefix = self.prefix_combo.currentData()
-        text = self.label_input.text().strip()
-
-        if prefix and text:
-            return f"{prefix} {text}"
-        return text
+        return _final_text(self.prefix_combo.currentData(), self.label_input.text())
 
     def get_final_text_only_label_text(self):
         """Get the final text-only label text combining prefix and input"""
-        prefix = self.text_only_prefix_combo.currentData()
-        text = self.text_only_input.text().strip()
-
-        if prefix and text:
-            return f"{prefix} {text}"
-        return text
+        return _final_text(self.text_only_prefix_combo.currentData(), self.text_only_input.text())
 
     def validate_inputs(self):
         """Validate input fields and provide visual feedback"""
@@ -1293,35 +1625,18 @@ class LabelPrinterGUI(QMainWindow):
     def increment_label(self):
         """Increment the number in the label text"""
         text = self.label_input.text()
-        import re
+        incremented = _increment_trailing_number(text)
 
-        # If prefix is selected, just increment the number
+        # If prefix is selected, the text should be just a number
         prefix = self.prefix_combo.currentData()
-        if prefix:
-            # Text should be just a number when prefix is selected
-            if text.isdigit():
-                self.label_input.setText(str(int(text) + 1))
-            else:
-                # Find trailing number in case user typed something else
-                match = re.search(r'(\d+)$', text)
-                if match:
-                    num = int(match.group(1))
-                    new_text = text[:match.start()] + str(num + 1)
-                    self.label_input.setText(new_text)
-                else:
-                    # If no number, start with 1
-                    self.label_input.setText("1")
+        if incremented is not None:
+            self.label_input.setText(incremented)
+        elif prefix:
+            # If no number, start with 1
+            self.label_input.setText("1")
         else:
-            # Original behavior for full text labels
-            # Find trailing number
-            match = re.search(r'(\d+)$', text)
-            if match:
-                num = int(match.group(1))
-                new_text = text[:match.start()] + str(num + 1)
-                self.label_input.setText(new_text)
-            else:
-                # If no number, append " 2"
-                self.label_input.setText(text + " 2")
+            # If no number, append " 2"
+            self.label_input.setText(text + " 2")
 
     def get_copies(self):
         """Get the currently selected number of copies"""
@@ -1331,7 +1646,7 @@ class LabelPrinterGUI(QMainWindow):
         """Clear all input fields"""
         self.url_input.clear()
         self.label_input.clear()
-        self.preview_label.setPixmap(QPixmap())
+        self.preview_label.clear_pixmap()
         self.preview_label.setText("Generate a preview to see your label")
         self.preview_image = None
         self.print_button.setEnabled(False)
@@ -1343,29 +1658,20 @@ class LabelPrinterGUI(QMainWindow):
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
-        # Enter to generate preview
-        preview_action = QAction(self)
-        preview_action.setShortcut(QKeySequence(Qt.Key.Key_Return))
-        preview_action.triggered.connect(self.generate_preview)
-        self.addAction(preview_action)
-
-        # Ctrl+P to print
-        print_action = QAction(self)
-        print_action.setShortcut(QKeySequence("Ctrl+P"))
-        print_action.triggered.connect(self.print_label)
-        self.addAction(print_action)
-
-        # Ctrl+R to clear/reset
-        clear_action = QAction(self)
-        clear_action.setShortcut(QKeySequence("Ctrl+R"))
-        clear_action.triggered.connect(self.clear_form)
-        self.addAction(clear_action)
-
-        # Ctrl+Up to increment label
-        increment_action = QAction(self)
-        increment_action.setShortcut(QKeySequence("Ctrl+Up"))
-        increment_action.triggered.connect(self.handle_increment_shortcut)
-        self.addAction(increment_action)
+        # Preview/print/reset act on the QR + Text tab, so scope them to it
+        qr_text_tab = self.tab_widget.widget(0)
+        for key, handler in (
+            (QKeySequence(Qt.Key.Key_Return), self.generate_preview),  # Enter to generate preview
+            (QKeySequence("Ctrl+P"), self.print_label),  # Ctrl+P to print
+            (QKeySequence("Ctrl+R"), self.clear_form),  # Ctrl+R to clear/reset
+        ):
+            shortcut = QShortcut(key, qr_text_tab)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(handler)
+
+        # Ctrl+Up to increment label (dispatches on the current tab)
+        increment_shortcut = QShortcut(QKeySequence("Ctrl+Up"), self)
+        increment_shortcut.activated.connect(self.handle_increment_shortcut)
 
         # Tab change event for auto-focus
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -1380,7 +1686,8 @@ class LabelPrinterGUI(QMainWindow):
         # Batch mode and Batch Range don't have increment functionality
 
     def on_tab_changed(self, index):
-        """Auto-focus on primary input field when tab changes"""
+        """Build the tab if needed and auto-focus its primary input field"""
+        self.ensure_tab_built(index)
         # Small delay to ensure tab is fully loaded
         QTimer.singleShot(50, lambda: self._set_tab_focus(index))
 
@@ -1426,13 +1733,15 @@ class LabelPrinterGUI(QMainWindow):
         copies_combo.setCurrentIndex(self.last_copies - 1)
         self.batch_table.setCellWidget(row, 2, copies_combo)
 
-        # Connect copies change to track last used
-        copies_combo.currentIndexChanged.connect(
-            lambda: self.update_last_copies(copies_combo.currentData())
-        )
+        # Connect copies change to track last used (one shared slot for all rows)
+        copies_combo.currentIndexChanged.connect(self.on_batch_copies_changed)
 
         self.statusBar().showMessage(f"Added label {row + 1} to batch")
 
+    def on_batch_copies_changed(self, index):
+        """Track the copies value chosen in any batch row's dropdown"""
+        self.update_last_copies(self.sender().itemData(index))
+
     def update_last_copies(self, value):
         """Update the last used copies value"""
         self.last_copies = value
@@ -1464,7 +1773,7 @@ class LabelPrinterGUI(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.batch_table.setRowCount(0)
-            self.batch_preview_label.setPixmap(QPixmap())
+            self.batch_preview_label.clear_pixmap()
             self.batch_preview_label.setText("Add labels and click 'Preview All Labels' to see your batch")
             self.statusBar().showMessage("Batch cleared")
 
@@ -1506,105 +1815,26 @@ class LabelPrinterGUI(QMainWindow):
             template = self.batch_template_combo.currentData()
             prefix = self.batch_prefix_combo.currentData()
 
+            # Apply prefix if selected
+            jobs = []
             for url, label_text, copies in labels:
-                # Apply prefix if selected
                 if prefix and label_text:
                     final_label_text = f"{prefix} {label_text}"
                 else:
                     final_label_text = label_text
-                # Generate image based on template selection
-                if template == 1:
-                    img = create_label_image(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 2:
-                    img = create_label_image_template2(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 3:
-                    img = create_label_image_template3(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 4:
-                    img = create_text_only_label(
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 5:
-                    img = create_vertical_text_label(
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-                elif template == 6:
-                    img = create_label_image_template6(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 7:
-                    # Shelf label: split text into label and number
-                    parts = final_label_text.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        label_part, number = parts
-                    else:
-                        label_part = final_label_text
-                        number = ""
-                    img = create_shelf_label(
-                        label_text=label_part,
-                        number=number,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-                elif template == 8:
-                    # Storage QR label: QR code with storage type below and large number on right
-                    parts = final_label_text.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        storage_type, number = parts
-                    else:
-                        storage_type = final_label_text
-                        number = ""
-                    img = create_storage_qr_label(
-                        qr_data=url,
-                        storage_type=storage_type,
-                        number=number,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-                preview_images.append(img)
+                jobs.append((url, final_label_text))
+
+            # Generate images based on template selection (in parallel)
+            preview_images = render_batch_images(
+                template, jobs, tape_width, DEFAULT_FONT, font_size
+            )
 
             # Combine images vertically for preview
             if preview_images:
-                total_height = sum(img.height for img in preview_images) + (len(preview_images) - 1) * 10
-                max_width = max(img.width for img in preview_images)
+                combined = stack_images_vertically(preview_images)
 
-                combined = Image.new("RGB", (max_width, total_height), (255, 255, 255))
-                y_offset = 0
-                for img in preview_images:
-                    combined.paste(img, (0, y_offset))
-                    y_offset += img.height + 10
-
-                # Save and display
-                temp_path = "/tmp/brother_ql_batch_preview.png"
-                combined.save(temp_path)
-
-                pixmap = QPixmap(temp_path)
+                # Convert and display
+                pixmap = pil_to_qpixmap(combined)
                 self.batch_preview_label.setPixmap(pixmap)
                 self.batch_preview_label.setScaledContents(False)
 
@@ -1665,109 +1895,42 @@ class LabelPrinterGUI(QMainWindow):
             font_size = self.font_size
             template = self.batch_template_combo.currentData()
             prefix = self.batch_prefix_combo.currentData()
-            printed_count = 0
-
-            for idx, (url, label_text, copies) in enumerate(labels, 1):
-                self.statusBar().showMessage(f"Printing label {idx}/{len(labels)}...")
 
-                # Apply prefix if selected
+            # Apply prefix if selected
+            jobs = []
+            for url, label_text, copies in labels:
                 if prefix and label_text:
                     final_label_text = f"{prefix} {label_text}"
                 else:
                     final_label_text = label_text
+                jobs.append((url, final_label_text))
 
-                # Generate image based on template selection
-                if template == 1:
-                    img = create_label_image(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 2:
-                    img = create_label_image_template2(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 3:
-                    img = create_label_image_template3(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 4:
-                    img = create_text_only_label(
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 5:
-                    img = create_vertical_text_label(
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-                elif template == 6:
-                    img = create_label_image_template6(
-                        qr_data=url,
-                        text=final_label_text,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT,
-                        font_size=font_size
-                    )
-                elif template == 7:
-                    # Shelf label: split text into label and number
-                    parts = final_label_text.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        label_part, number = parts
-                    else:
-                        label_part = final_label_text
-                        number = ""
-                    img = create_shelf_label(
-                        label_text=label_part,
-                        number=number,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-                elif template == 8:
-                    # Storage QR label: QR code with storage type below and large number on right
-                    parts = final_label_text.rsplit(' ', 1)
-                    if len(parts) == 2:
-                        storage_type, number = parts
-                    else:
-                        storage_type = final_label_text
-                        number = ""
-                    img = create_storage_qr_label(
-                        qr_data=url,
-                        storage_type=storage_type,
-                        number=number,
-                        tape_width_mm=tape_width,
-                        font_path=DEFAULT_FONT
-                    )
-
-                # Save to temp file
-                temp_path = "/tmp/brother_ql_batch_print.png"
-                img.save(temp_path)
+            # Render every label up front (in parallel), then print in order
+            self.statusBar().showMessage(f"Rendering {len(labels)} labels...")
+            images = render_batch_images(
+                template, jobs, tape_width, DEFAULT_FONT, font_size
+            )
 
+            # Local USB printers get the whole batch as one multi-page job
+            uri = get_printer_uri(self.printer_name) if self.printer_name else None
+            if uri and (uri.startswith('usb://') or uri.startswith('file://')):
+                pages = [img for (url, label_text, copies), img in zip(labels, images)
+                         for _ in range(copies)]
+                steps = [(f"Sending {len(pages)} labels to printer...",
+                          print_local_usb_pages, (pages, tape_width, self.cut_every))]
+            else:
                 # Print label (auto-detects local USB vs network printer)
-                success, message = print_label_image(temp_path, self.printer_name, tape_width, copies)
-                if success:
-                    printed_count += copies
-                else:
-                    raise Exception(message)
-
-            self.statusBar().showMessage(f"Batch print complete! {printed_count} labels sent.")
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Batch sent to {self.printer_name}!\n{len(labels)} designs, {printed_count} total labels."
+                steps = [
+                    (f"Printing label {idx}/{len(labels)}...", print_label_image,
+                     (img, self.printer_name, tape_width, copies))
+                    for idx, ((url, label_text, copies), img) in enumerate(zip(labels, images), 1)
+                ]
+
+            self.start_print_job(
+                steps,
+                f"Batch print complete! {total_copies} labels sent.",
+                f"Batch sent to {self.printer_name}!\n{len(labels)} designs, {total_copies} total labels.",
+                "Failed to print batch:\n", "Batch print failed"
             )
 
         except Exception as e:
@@ -1783,47 +1946,44 @@ class LabelPrinterGUI(QMainWindow):
         """Handle text-only input field changes"""
         # Clear cached preview
         self.text_only_preview_image = None
-        if hasattr(self, 'text_only_preview_label') and self.text_only_preview_label.pixmap() and not self.text_only_preview_label.pixmap().isNull():
-            self.text_only_preview_label.setPixmap(QPixmap())
+        self._text_only_invalidate_timer.start()
+        self._text_only_preview_timer.start(150)
+
+    def auto_text_only_preview(self):
+        """Regenerate the text-only preview after input settles (silently skips empty input)"""
+        if self.tab_widget.currentIndex() != 2:
+            return
+        if not self.text_only_input.text().strip():
+            return
+        self.generate_text_only_preview()
+
+    def _do_text_only_invalidate(self):
+        """Mark the text-only preview display outdated (debounced)"""
+        # Only reachable once the tab (and so the label) has been built
+        if self.text_only_preview_label.has_pixmap():
+            self.text_only_preview_label.clear_pixmap()
             self.text_only_preview_label.setText("Preview cleared - generate new preview or print directly")
 
     def increment_text_only_label(self):
         """Increment the number in the text-only label"""
         text = self.text_only_input.text()
-        import re
+        incremented = _increment_trailing_number(text)
 
-        # If prefix is selected, just increment the number
+        # If prefix is selected, the text should be just a number
         prefix = self.text_only_prefix_combo.currentData()
-        if prefix:
-            # Text should be just a number when prefix is selected
-            if text.isdigit():
-                self.text_only_input.setText(str(int(text) + 1))
-            else:
-                # Find trailing number in case user typed something else
-                match = re.search(r'(\d+)$', text)
-                if match:
-                    num = int(match.group(1))
-                    new_text = text[:match.start()] + str(num + 1)
-                    self.text_only_input.setText(new_text)
-                else:
-                    # If no number, start with 1
-                    self.text_only_input.setText("1")
+        if incremented is not None:
+            self.text_only_input.setText(incremented)
+        elif prefix:
+            # If no number, start with 1
+            self.text_only_input.setText("1")
         else:
-            # Original behavior for full text labels
-            # Find trailing number
-            match = re.search(r'(\d+)$', text)
-            if match:
-                num = int(match.group(1))
-                new_text = text[:match.start()] + str(num + 1)
-                self.text_only_input.setText(new_text)
-            else:
-                # If no number, append " 2"
-                self.text_only_input.setText(text + " 2")
+            # If no number, append " 2"
+            self.text_only_input.setText(text + " 2")
 
     def clear_text_only_form(self):
         """Clear the text-only form"""
         self.text_only_input.clear()
-        self.text_only_preview_label.setPixmap(QPixmap())
+        self.text_only_preview_label.clear_pixmap()
         self.text_only_preview_label.setText("Generate a preview to see your label")
         self.text_only_preview_image = None
 
@@ -1838,6 +1998,11 @@ class LabelPrinterGUI(QMainWindow):
 
     def generate_text_only_preview(self):
         """Generate preview for text-only label"""
+        # Apply any pending invalidation now so it cannot clear the new preview
+        if self._text_only_invalidate_timer.isActive():
+            self._text_only_invalidate_timer.stop()
+            self._do_text_only_invalidate()
+
         text = self.text_only_input.text().strip()
 
         if not text:
@@ -1858,28 +2023,24 @@ class LabelPrinterGUI(QMainWindow):
             template = self.text_only_template_combo.currentData()
 
             # Generate image based on template
-            if template == "vertical":
-                self.text_only_preview_image = create_vertical_text_label(
-                    text=final_text,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path
-                )
-            else:
-                self.text_only_preview_image = create_text_only_label(
-                    text=final_text,
-                    tape_width_mm=self.tape_width,
-                    font_path=self.font_path,
-                    font_size=self.font_size
-                )
-
-            # Save to temp file and display
-            temp_path = "/tmp/brother_ql_text_only_preview.png"
-            self.text_only_preview_image.save(temp_path)
+            self.text_only_preview_image = render_template_image(
+                TEXT_ONLY_TEMPLATES[template], "", final_text, self.tape_width,
+                self.font_path, self.font_size, False
+            )
 
-            # Load and display preview
-            pixmap = QPixmap(temp_path)
-            self.text_only_preview_label.setPixmap(pixmap)
-            self.text_only_preview_label.setScaledContents(False)
+            # Convert and display preview, unless this exact preview is already shown
+            pixmap_key = "text_only:{}".format(hash((
+                template, final_text, self.tape_width, self.font_path,
+                font_file_mtime(self.font_path), self.font_size
+            )))
+            if pixmap_key != self._text_only_pixmap_key or not self.text_only_preview_label.has_pixmap():
+                pixmap = QPixmapCache.find(pixmap_key)
+                if pixmap is None:
+                    pixmap = pil_to_qpixmap(self.text_only_preview_image)
+                    QPixmapCache.insert(pixmap_key, pixmap)
+                self.text_only_preview_label.setPixmap(pixmap)
+                self.text_only_preview_label.setScaledContents(False)
+                self._text_only_pixmap_key = pixmap_key
 
             tape_width = self.tape_width
             self.statusBar().showMessage(
@@ -1908,7 +2069,7 @@ class LabelPrinterGUI(QMainWindow):
             return
 
         # Generate image if not already previewed
-        if not hasattr(self, 'text_only_preview_image') or not self.text_only_preview_image:
+        if self.text_only_preview_image is None:
             try:
                 # Get final label text with prefix
                 final_text = self.get_final_text_only_label_text()
@@ -1917,19 +2078,10 @@ class LabelPrinterGUI(QMainWindow):
                 template = self.text_only_template_combo.currentData()
 
                 # Generate image based on template
-                if template == "vertical":
-                    self.text_only_preview_image = create_vertical_text_label(
-                        text=final_text,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path
-                    )
-                else:
-                    self.text_only_preview_image = create_text_only_label(
-                        text=final_text,
-                        tape_width_mm=self.tape_width,
-                        font_path=self.font_path,
-                        font_size=self.font_size
-                    )
+                self.text_only_preview_image = render_template_image(
+                    TEXT_ONLY_TEMPLATES[template], "", final_text, self.tape_width,
+                    self.font_path, self.font_size, False
+                )
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -1948,29 +2100,14 @@ class LabelPrinterGUI(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Save to temp file
-            temp_path = "/tmp/brother_ql_text_only_print.png"
-            self.text_only_preview_image.save(temp_path)
-
-            self.statusBar().showMessage(f"Sending {copies} label(s) to printer...")
-
             # Print label (auto-detects local USB vs network printer)
-            success, message = print_label_image(temp_path, self.printer_name, self.tape_width, copies)
-
-            if success:
-                self.statusBar().showMessage(f"Print complete! {copies} label{'s' if copies > 1 else ''} sent.")
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"{copies} text-only label{'s' if copies > 1 else ''} sent to {self.printer_name}!"
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Print Error",
-                    message
-                )
-                self.statusBar().showMessage("Print failed")
+            self.start_print_job(
+                [(f"Sending {copies} label(s) to printer...", print_label_image,
+                  (self.text_only_preview_image, self.printer_name, self.tape_width, copies,
+                   self.cut_every))],
+                f"Print complete! {copies} label{'s' if copies > 1 else ''} sent.",
+                f"{copies} text-only label{'s' if copies > 1 else ''} sent to {self.printer_name}!"
+            )
 
     def init_batch_range_tab(self, parent):
         """Initialize the batch range text-only printing tab"""
@@ -1986,11 +2123,7 @@ class LabelPrinterGUI(QMainWindow):
         prefix_label.setMinimumWidth(80)
         prefix_layout.addWidget(prefix_label)
         self.batch_range_prefix_combo = QComboBox()
-        self.batch_range_prefix_combo.addItem("None", "")
-        self.batch_range_prefix_combo.addItem("Box", "Box")
-        self.batch_range_prefix_combo.addItem("Container", "Container")
-        self.batch_range_prefix_combo.addItem("Shelf", "Shelf")
-        self.batch_range_prefix_combo.addItem("Asset", "Asset")
+        populate_combo(self.batch_range_prefix_combo, PREFIX_OPTIONS)
         self.batch_range_prefix_combo.setToolTip("Select a prefix to add before the label numbers")
         prefix_layout.addWidget(self.batch_range_prefix_combo)
         prefix_layout.addStretch()
@@ -2071,7 +2204,7 @@ class LabelPrinterGUI(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setMinimumHeight(200)
 
-        self.batch_range_preview_label = QLabel("Set range and click 'Preview Range' to see your labels")
+        self.batch_range_preview_label = PreviewLabel("Set range and click 'Preview Range' to see your labels")
         self.batch_range_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.batch_range_preview_label.setStyleSheet("QLabel { background-color: #f0f0f0; padding: 20px; }")
 
@@ -2095,15 +2228,6 @@ class LabelPrinterGUI(QMainWindow):
             return
 
         label_count = last_num - first_num + 1
-        if label_count > 100:
-            reply = QMessageBox.question(
-                self,
-                "Large Batch",
-                f"This will generate {label_count} labels. Continue?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
 
         try:
             self.statusBar().showMessage(f"Generating preview for {label_count} labels...")
@@ -2114,56 +2238,24 @@ class LabelPrinterGUI(QMainWindow):
             font_path = self.font_path
             font_size = self.font_size
 
-            # Generate preview images
-            preview_images = []
-            for num in range(first_num, last_num + 1):
-                # Create label text
-                if prefix:
-                    label_text = f"{prefix} {num}"
-                else:
-                    label_text = str(num)
-
-                # Generate image based on template
-                if template == "vertical":
-                    # For vertical, use create_text_only_label with custom font size
-                    img = create_text_only_label(
-                        text=label_text,
-                        tape_width_mm=tape_width,
-                        font_path=font_path,
-                        font_size=font_size
-                    )
-                    # Rotate for vertical display
-                    img = img.rotate(90, expand=True)
-                else:  # horizontal
-                    img = create_text_only_label(
-                        text=label_text,
-                        tape_width_mm=tape_width,
-                        font_path=font_path,
-                        font_size=font_size
-                    )
-                preview_images.append(img)
+            # Only the labels the preview shows are rendered
+            last_shown = min(last_num, first_num + RANGE_PREVIEW_LIMIT - 1)
+            display_images = render_range_images(
+                batch_range_texts(prefix, first_num, last_shown), template == "vertical",
+                tape_width, font_path, font_size
+            )
 
-            # Combine images vertically for preview (limit to first 20 for display)
-            display_images = preview_images[:20]
+            # Combine images vertically for preview
             if display_images:
-                total_height = sum(img.height for img in display_images) + (len(display_images) - 1) * 10
-                max_width = max(img.width for img in display_images)
-
-                combined = Image.new("RGB", (max_width, total_height), (255, 255, 255))
-                y_offset = 0
-                for img in display_images:
-                    combined.paste(img, (0, y_offset))
-                    y_offset += img.height + 10
+                combined = stack_images_vertically(display_images)
 
-                # Save and display
-                temp_path = "/tmp/brother_ql_batch_range_preview.png"
-                combined.save(temp_path)
-
-                pixmap = QPixmap(temp_path)
+                # Convert and display
+                pixmap = pil_to_qpixmap(combined)
                 self.batch_range_preview_label.setPixmap(pixmap)
                 self.batch_range_preview_label.setScaledContents(False)
 
-                preview_note = f" (showing first 20)" if len(preview_images) > 20 else ""
+                preview_note = (f" (showing first {RANGE_PREVIEW_LIMIT})"
+                                if label_count > RANGE_PREVIEW_LIMIT else "")
                 self.statusBar().showMessage(f"Range preview generated: {label_count} labels{preview_note}")
 
         except Exception as e:
@@ -2208,49 +2300,38 @@ class LabelPrinterGUI(QMainWindow):
             font_path = self.font_path
             font_size = self.font_size
 
-            # Print each label
-            for idx, num in enumerate(range(first_num, last_num + 1), 1):
-                self.statusBar().showMessage(f"Printing label {idx}/{label_count}...")
-
-                # Create label text
-                if prefix:
-                    label_text = f"{prefix} {num}"
-                else:
-                    label_text = str(num)
-
-                # Generate image based on template
-                if template == "vertical":
-                    # For vertical, use create_text_only_label with custom font size
-                    img = create_text_only_label(
-                        text=label_text,
-                        tape_width_mm=tape_width,
-                        font_path=font_path,
-                        font_size=font_size
-                    )
-                    # Rotate for vertical display
-                    img = img.rotate(90, expand=True)
-                else:  # horizontal
-                    img = create_text_only_label(
-                        text=label_text,
-                        tape_width_mm=tape_width,
-                        font_path=font_path,
-                        font_size=font_size
-                    )
-
-                # Save to temp file
-                temp_path = "/tmp/brother_ql_batch_range_print.png"
-                img.save(temp_path)
-
+            # Labels are rendered on the print thread as each step runs, so
+            # neither the UI nor memory scales with the length of the range
+            label_texts = batch_range_texts(prefix, first_num, last_num)
+            vertical = template == "vertical"
+
+            # Local USB printers get the range as multi-page jobs of a bounded
+            # size, kept a multiple of cut_every so cuts land where they would
+            # in a single job
+            uri = get_printer_uri(self.printer_name) if self.printer_name else None
+            if uri and (uri.startswith('usb://') or uri.startswith('file://')):
+                cut_every = self.cut_every
+                chunk = max(1, RANGE_PRINT_CHUNK // cut_every) * cut_every
+                steps = [
+                    (f"Printing labels {start + 1}-{min(start + chunk, label_count)}"
+                     f"/{label_count}...", print_range_chunk,
+                     (label_texts[start:start + chunk], vertical, tape_width,
+                      font_path, font_size, cut_every))
+                    for start in range(0, label_count, chunk)
+                ]
+            else:
                 # Print label (auto-detects local USB vs network printer)
-                success, message = print_label_image(temp_path, self.printer_name, tape_width, 1)
-                if not success:
-                    raise Exception(message)
-
-            self.statusBar().showMessage(f"Batch range print complete! {label_count} labels sent.")
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Batch range sent to {self.printer_name}!\n{label_count} labels."
+                steps = [
+                    (f"Printing label {idx}/{label_count}...", print_range_label,
+                     (text, vertical, tape_width, font_path, font_size, self.printer_name))
+                    for idx, text in enumerate(label_texts, 1)
+                ]
+
+            self.start_print_job(
+                steps,
+                f"Batch range print complete! {label_count} labels sent.",
+                f"Batch range sent to {self.printer_name}!\n{label_count} labels.",
+                "Failed to print batch range:\n", "Batch range print failed"
             )
 
         except Exception as e:
@@ -2360,13 +2441,9 @@ class LabelPrinterGUI(QMainWindow):
             try:
                 preview_img = template_info["function"](**template_info["params"])
 
-                # Save to temp file
-                temp_path = f"/tmp/brother_ql_template_preview_{templates.index(template_info)}.png"
-                preview_img.save(temp_path)
-
                 # Display preview
                 preview_label = QLabel()
-                pixmap = QPixmap(temp_path)
+                pixmap = pil_to_qpixmap(preview_img)
 
                 # Scale down if too large for display (max width 800px)
                 if pixmap.width() > 800:
@@ -2426,6 +2503,14 @@ class LabelPrinterGUI(QMainWindow):
         version.setStyleSheet("color: gray;")
         content_layout.addWidget(version)
 
+        # Imaging library build (Pillow-SIMD releases carry a ".postN" suffix)
+        pillow_name = "Pillow-SIMD" if ".post" in Image.__version__ else "Pillow"
+        pillow_version = QLabel(f"{pillow_name} {Image.__version__}")
+        pillow_version.setFont(QFont("Sans", 9))
+        pillow_version.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        pillow_version.setStyleSheet("color: gray;")
+        content_layout.addWidget(pillow_version)
+
         content_layout.addSpacing(10)
 
         # Application Description
@@ -2456,38 +2541,39 @@ class LabelPrinterGUI(QMainWindow):
         tape_info.setStyleSheet("padding: 10px; margin-bottom: 5px;")
         tape_layout.addWidget(tape_info)
 
-        # Tape specifications table
-        tape_specs = [
-            ("29mm", "DK-22210", "Continuous Length Paper (White)"),
-            ("38mm", "DK-22225", "Continuous Length Paper (White)"),
-            ("50mm", "DK-22223", "Continuous Length Paper (White)"),
-            ("62mm", "DK-22205", "Continuous Length Paper (White)")
-        ]
-
-        for width, product_code, description in tape_specs:
-            tape_item = QWidget()
-            tape_item_layout = QHBoxLayout(tape_item)
-            tape_item_layout.setContentsMargins(10, 5, 10, 5)
-
-            # Width label
-            width_label = QLabel(width)
-            width_label.setFont(QFont("Sans", 11, QFont.Weight.Bold))
-            width_label.setMinimumWidth(60)
-            tape_item_layout.addWidget(width_label)
-
-            # Product code
-            code_label = QLabel(product_code)
-            code_label.setFont(QFont("Monospace", 10, QFont.Weight.Bold))
-            code_label.setStyleSheet("background-color: #f0f0f0; padding: 5px; border-radius: 3px;")
-            code_label.setMinimumWidth(100)
-            tape_item_layout.addWidget(code_label)
-
-            # Description
-            desc_label = QLabel(description)
-            desc_label.setStyleSheet("color: #555;")
-            tape_item_layout.addWidget(desc_label, 1)
-
-            tape_layout.addWidget(tape_item)
+        # Tape specifications table (one read-only table instead of a widget per row)
+        tape_table = QTableWidget(len(TAPE_SPECS), 3)
+        tape_table.setHorizontalHeaderLabels(["Width", "Product Code", "Description"])
+        tape_table.verticalHeader().setVisible(False)
+        tape_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        tape_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        tape_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        tape_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        tape_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        tape_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        tape_table.setStyleSheet("QTableWidget { border: none; } QTableWidget::item { padding: 5px; }")
+
+        width_font = QFont("Sans", 11, QFont.Weight.Bold)
+        code_font = QFont("Monospace", 10, QFont.Weight.Bold)
+        for row, (width, product_code, description) in enumerate(TAPE_SPECS):
+            width_item = QTableWidgetItem(width)
+            width_item.setFont(width_font)
+            code_item = QTableWidgetItem(product_code)
+            code_item.setFont(code_font)
+            desc_item = QTableWidgetItem(description)
+            desc_item.setForeground(QColor("#555"))
+            tape_table.setItem(row, 0, width_item)
+            tape_table.setItem(row, 1, code_item)
+            tape_table.setItem(row, 2, desc_item)
+
+        # Size the table to its rows so the About tab scrolls as a whole
+        tape_table.resizeRowsToContents()
+        tape_table.setFixedHeight(
+            tape_table.horizontalHeader().height()
+            + sum(tape_table.rowHeight(row) for row in range(len(TAPE_SPECS)))
+            + 2 * tape_table.frameWidth()
+        )
+        tape_layout.addWidget(tape_table)
 
         # Note about compatibility
         note_label = QLabel(
@@ -2518,10 +2604,11 @@ class LabelPrinterGUI(QMainWindow):
             "Auto-increment label numbers with +1 button or Ctrl+Up"
         ]
 
+        features_group.setStyleSheet("QLabel#feature { padding: 3px 10px; }")
         for feature in features_list:
             feature_label = QLabel(f"• {feature}")
+            feature_label.setObjectName("feature")
             feature_label.setWordWrap(True)
-            feature_label.setStyleSheet("padding: 3px 10px;")
             features_layout.addWidget(feature_label)
 
         features_group.setLayout(features_layout)
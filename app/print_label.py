@@ -10,26 +10,27 @@ Layout: [Box Icon] [QR Code] [Text Label]
 """
 
 import argparse
+import logging
 import os
-import sys
-from contextlib import contextmanager
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import qrcode
 from brother_ql.raster import BrotherQLRaster
 from brother_ql.conversion import convert
 from brother_ql.backends.helpers import send
+from brother_ql.models import ALL_MODELS
 
 
-@contextmanager
-def suppress_stderr():
-    """Temporarily suppress stderr output"""
-    original_stderr = sys.stderr
-    sys.stderr = open(os.devnull, 'w')
-    try:
-        yield
-    finally:
-        sys.stderr.close()
-        sys.stderr = original_stderr
+class _OperatingModeFilter(logging.Filter):
+    """Drop brother_ql's harmless 'operating mode' warning for the QL-700"""
+
+    def filter(self, record):
+        return "operating mode" not in record.getMessage()
+
+
+# convert() warns on every job that the QL-700 lacks the mode switch command;
+# filter just that message once instead of silencing stderr around each call
+logging.getLogger("brother_ql.raster").addFilter(_OperatingModeFilter())
 
 # Tape width specifications (at 300 DPI)
 TAPE_WIDTHS = {
@@ -61,7 +62,18 @@ def get_scale_factor(tape_width_mm: int) -> float:
         return 1.0
     return TAPE_WIDTHS[tape_width_mm] / REFERENCE_TAPE_PIXELS
 
+
+def get_tape_geometry(tape_width_mm: int):
+    """Return (label_height_px, scale) for a supported tape width (raises ValueError otherwise)"""
+    if tape_width_mm not in TAPE_WIDTHS:
+        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
+                         f"Supported: {list(TAPE_WIDTHS.keys())}")
+    return TAPE_WIDTHS[tape_width_mm], get_scale_factor(tape_width_mm)
+
 PRINTER_MODEL = "QL-700"
+# PackBits raster compression (smaller USB transfers) where the model supports it;
+# the QL-700 does not, and brother_ql only logs a warning if asked anyway
+COMPRESS_RASTER = any(m.identifier == PRINTER_MODEL and m.compression for m in ALL_MODELS)
 DEFAULT_PRINTER = "usb://0x04f9:0x2042"
 DEFAULT_BACKEND = "pyusb"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -69,6 +81,140 @@ DEFAULT_FONT = os.path.join(SCRIPT_DIR, "fonts", "static", "Archivo-Bold.ttf")
 BOX_ICON_PATH = os.path.join(SCRIPT_DIR, "assets", "box.png")
 
 
+@lru_cache(maxsize=256)
+def _get_font(font_path, font_size, font_mtime):
+    """Load a TrueType font (cached; mtime in the key invalidates edited fonts)"""
+    return ImageFont.truetype(font_path, font_size)
+
+
+def get_font(font_path, font_size):
+    """Return a cached ImageFont for font_path at font_size"""
+    try:
+        font_mtime = os.path.getmtime(font_path)
+    except OSError:
+        font_mtime = None
+    return _get_font(font_path, font_size, font_mtime)
+
+
+@lru_cache(maxsize=1024)
+def text_bbox(font, text):
+    """Cached font.getbbox(text); same result as ImageDraw.textbbox at (0, 0)"""
+    return font.getbbox(text)
+
+
+def measure_text_width(font, text):
+    """Horizontal extent of text drawn in font"""
+    bbox = text_bbox(font, text)
+    return bbox[2] - bbox[0]
+
+
+def font_line_height(font):
+    """Ascent + descent of a font, the height of any single line of text"""
+    ascent, descent = font.getmetrics()
+    return ascent + descent
+
+
+def fit_font_size(font_path, min_size, max_size, target, measure):
+    """Largest size between min_size and max_size whose measure(font) fits target
+
+    Same result as bisecting the open interval (min_size, max_size), falling back
+    to max_size when nothing in it fits, but glyph metrics scale almost linearly
+    with size, so one measurement at max_size predicts the answer and only the
+    sizes next to the prediction are loaded to confirm it.
+    """
+    if max_size - min_size <= 1:
+        return max_size
+
+    def fits(size):
+        return measure(get_font(font_path, size)) <= target
+
+    reference = measure(get_font(font_path, max_size))
+    if reference <= target:
+        size = max_size - 1
+    else:
+        size = int(max_size * target // reference)
+    size = max(min_size + 1, min(max_size - 1, size))
+
+    if fits(size):
+        while size + 1 < max_size and fits(size + 1):
+            size += 1
+        return size
+    while size - 1 > min_size:
+        size -= 1
+        if fits(size):
+            return size
+    return max_size
+
+
+# Alpha lookup table for the box icon watermark (30% opacity)
+WATERMARK_ALPHA_LUT = [int(p * 0.3) for p in range(256)]
+
+# Box icon cache: None holds the decoded source, int keys hold resized variants
+_BOX_ICON_CACHE = {}
+
+
+def get_box_icon(size):
+    """Return the box icon as an RGBA image resized to size x size (cached - copy before modifying)"""
+    if size not in _BOX_ICON_CACHE:
+        if None not in _BOX_ICON_CACHE:
+            _BOX_ICON_CACHE[None] = Image.open(BOX_ICON_PATH).convert("RGBA")
+        _BOX_ICON_CACHE[size] = _BOX_ICON_CACHE[None].resize(
+            (size, size), Image.Resampling.LANCZOS
+        )
+    return _BOX_ICON_CACHE[size]
+
+
+@lru_cache(maxsize=8)
+def get_box_watermark(size):
+    """
+    Return the box watermark as a size x size greyscale tile (cached - do not modify).
+
+    The icon always sits on the white label background, so it is blended onto
+    white once here and pasted without a mask afterwards.
+    """
+    box_img = get_box_icon(size).convert("LA")
+    box_img.putalpha(box_img.getchannel("A").point(WATERMARK_ALPHA_LUT))
+    tile = Image.new("L", (size, size), 255)
+    tile.paste(box_img, (0, 0), box_img)
+    return tile
+
+
+@lru_cache(maxsize=128)
+def render_rotated_text(font, text, padding, rotation):
+    """
+    Return text drawn black on white and turned by a quarter-turn transpose
+    (cached - do not modify).
+
+    padding is added to each dimension, split evenly around the text. Repeated
+    labels (batch runs, preview then print) reuse the rasterised block.
+    """
+    bbox = text_bbox(font, text)
+    text_img = Image.new("L", (bbox[2] - bbox[0] + padding, bbox[3] - bbox[1] + padding), 255)
+    ImageDraw.Draw(text_img).text((padding // 2, padding // 2), text, font=font, fill="black")
+    return text_img.transpose(rotation)
+
+
+@lru_cache(maxsize=64)
+def make_qr_image(qr_data, qr_size):
+    """Return a greyscale QR code image of qr_size x qr_size pixels (cached - do not modify)"""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,  # Medium ECC - good balance for small labels
+        box_size=10,
+        border=4,  # Standard quiet zone (4 modules) for reliable scanning
+    )
+    qr.add_data(qr_data)
+    qr.make(fit=True)
+    # Build the bitmap at one pixel per module straight from the module matrix
+    # (border included) instead of drawing box_size rectangles per module
+    matrix = qr.get_matrix()
+    modules = len(matrix)
+    qr_img = Image.new("L", (modules, modules))
+    qr_img.putdata([0 if dark else 255 for row in matrix for dark in row])
+    # Use NEAREST resampling to keep QR modules sharp and crisp
+    return qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+
+
 def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
                        font_path: str = DEFAULT_FONT, font_size: int = 100,
                        include_qr: bool = True) -> Image.Image:
@@ -92,28 +238,15 @@ def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
         include_qr: Whether to include QR code (default: True)
     """
 
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and other fixed sizes proportionally
     padding = int(15 * scale)
 
     # Decorative box icon scales with tape size
     box_icon_size = int(80 * scale)
-    box_img = Image.open(BOX_ICON_PATH).convert("RGBA")
-    box_img = box_img.resize((box_icon_size, box_icon_size), Image.Resampling.LANCZOS)
-
-    # Make box icon semi-transparent watermark
-    alpha = box_img.split()[3] if len(box_img.split()) == 4 else Image.new('L', box_img.size, 255)
-    alpha = alpha.point(lambda p: int(p * 0.3))  # 30% opacity
-    box_img.putalpha(alpha)
+    box_img = get_box_watermark(box_icon_size)
 
     # QR code generation (only if requested)
     qr_img = None
@@ -121,46 +254,21 @@ def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
     if include_qr:
         # QR code - scale to fill most of tape height with safe margins (85%)
         qr_size = int(label_height_px * 0.85)
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,  # Medium ECC - good balance for small labels
-            box_size=10,
-            border=4,  # Standard quiet zone (4 modules) for reliable scanning
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        # Use NEAREST resampling to keep QR modules sharp and crisp
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+        qr_img = make_qr_image(qr_data, qr_size)
 
     # Calculate maximum text height to fit within label
     target_height = label_height_px - (padding * 2)
 
-    # Binary search for optimal font size to fit text height within constraint
+    # Find the optimal font size to fit text height within constraint
     # Scale font sizes proportionally to tape width
     min_font_size = int(20 * scale)
     max_font_size = int(font_size * scale)  # Scale provided font_size by tape width
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text height using font metrics
-        ascent, descent = font.getmetrics()
-        text_height_measured = ascent + descent
-
-        if text_height_measured <= target_height:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_height, font_line_height)
 
     # Calculate text dimensions with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font = get_font(font_path, optimal_font_size)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
@@ -178,7 +286,7 @@ def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
     img_height = label_height_px
 
     # Create final image with white background
-    img = Image.new("RGBA", (img_width, img_height), (255, 255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
 
     # Paste QR code (only if included)
     if include_qr and qr_img:
@@ -205,14 +313,13 @@ def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
     # Paste small box icon in bottom right corner as subtle watermark
     box_x = img_width - box_icon_size - padding
     box_y = img_height - box_icon_size - padding
-    img.paste(box_img, (box_x, box_y), box_img)
+    img.paste(box_img, (box_x, box_y))
 
     # Add subtle border around the label (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)  # Light gray
+    border_color = 200  # Light gray
 
     # Draw border rectangle
-    draw = ImageDraw.Draw(img)
     draw.rectangle(
         [(border_width//2, border_width//2),
          (img_width - border_width//2 - 1, img_height - border_width//2 - 1)],
@@ -220,9 +327,6 @@ def create_label_image(qr_data: str, text: str, tape_width_mm: int = 29,
         width=border_width
     )
 
-    # Convert back to RGB for printing
-    img = img.convert("RGB")
-
     return img
 
 
@@ -244,15 +348,8 @@ def create_label_image_template2(qr_data: str, text: str, tape_width_mm: int = 2
         font_size: Font size in points (used as maximum, will be scaled down if needed)
         include_qr: Whether to include QR code (default: True)
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and gaps proportionally
     padding = int(15 * scale)
@@ -263,16 +360,7 @@ def create_label_image_template2(qr_data: str, text: str, tape_width_mm: int = 2
     qr_size = 0
     if include_qr:
         qr_size = int(label_height_px * 0.65)  # 65% for QR to leave room for text below
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+        qr_img = make_qr_image(qr_data, qr_size)
 
     # Calculate available space for text (must fit: QR + gap + text within label height)
     if include_qr:
@@ -280,31 +368,16 @@ def create_label_image_template2(qr_data: str, text: str, tape_width_mm: int = 2
     else:
         available_for_text = label_height_px - (padding * 2)
 
-    # Binary search for optimal font size to fit text within available space
+    # Find the optimal font size to fit text within available space
     # Scale font sizes proportionally to tape width
     min_font_size = int(20 * scale)
     max_font_size = int(font_size * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text height using font metrics
-        ascent, descent = font.getmetrics()
-        text_height_measured = ascent + descent
-
-        if text_height_measured <= available_for_text:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      available_for_text, font_line_height)
 
     # Calculate text dimensions with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font = get_font(font_path, optimal_font_size)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
 
     # Use font metrics for accurate vertical spacing
@@ -316,7 +389,8 @@ def create_label_image_template2(qr_data: str, text: str, tape_width_mm: int = 2
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
+    draw = ImageDraw.Draw(img)
 
     # Calculate vertical centering for the combined QR + text block
     if include_qr and qr_img:
@@ -328,22 +402,19 @@ def create_label_image_template2(qr_data: str, text: str, tape_width_mm: int = 2
         img.paste(qr_img, (qr_x, start_y))
 
         # Draw text below QR code (centered horizontally)
-        draw = ImageDraw.Draw(img)
         text_x = (img_width - text_width) // 2
 
         text_y = start_y + qr_size + text_gap
         draw.text((text_x, text_y), text, font=font, fill="black")
     else:
         # Text-only, centered both ways
-        draw = ImageDraw.Draw(img)
         text_x = (img_width - text_width) // 2
         text_y = (img_height - text_height_metrics) // 2
         draw.text((text_x, text_y), text, font=font, fill="black")
 
     # Add border (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)
-    draw = ImageDraw.Draw(img)
+    border_color = 200
     draw.rectangle(
         [(border_width//2, border_width//2),
          (img_width - border_width//2 - 1, img_height - border_width//2 - 1)],
@@ -371,15 +442,8 @@ def create_label_image_template3(qr_data: str, text: str, tape_width_mm: int = 2
         font_size: Font size in points (used as maximum, will be scaled down if needed)
         include_qr: Whether to include QR code (default: True)
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and other fixed sizes proportionally
     padding = int(15 * scale)
@@ -390,64 +454,27 @@ def create_label_image_template3(qr_data: str, text: str, tape_width_mm: int = 2
     qr_size = 0
     if include_qr:
         qr_size = int(label_height_px * 0.90)
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+        qr_img = make_qr_image(qr_data, qr_size)
 
     # Calculate maximum text height when rotated
     # After 90° counterclockwise rotation: text WIDTH becomes the vertical HEIGHT
     # So we need to constrain the text width to fit within label height
     target_height = label_height_px - (padding * 2)
 
-    # Binary search for optimal font size to fit text width within height constraint
+    # Find the optimal font size to fit text width within height constraint
     # Scale font sizes proportionally to tape width
     min_font_size = int(20 * scale)
     max_font_size = int(font_size * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        dummy = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy)
-
-        # Measure the actual text width (which becomes height after rotation)
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width_measured = bbox[2] - bbox[0]
-
-        # After 90° counterclockwise rotation, text width becomes the vertical dimension
-        # Check if the rotated text will fit within the label height
-        if text_width_measured <= target_height:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_height, lambda font: measure_text_width(font, text))
 
     # Create text with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    font = get_font(font_path, optimal_font_size)
 
-    # Create temporary image for text (will be rotated)
-    # Add padding to prevent cutoff during rotation (scaled)
+    # Text rotated 90° counterclockwise, with padding to prevent cutoff (scaled)
     text_img_padding = int(40 * scale)
-    text_img = Image.new("RGB", (text_width + text_img_padding, text_height + text_img_padding), (255, 255, 255))
-    text_draw = ImageDraw.Draw(text_img)
-    text_draw.text((text_img_padding // 2, text_img_padding // 2), text, font=font, fill="black")
-
-    # Rotate text 90° counterclockwise
-    text_img_rotated = text_img.rotate(90, expand=True)
+    text_img_rotated = render_rotated_text(font, text, text_img_padding,
+                                           Image.Transpose.ROTATE_90)
 
     # Calculate final image dimensions with extra right padding
     if include_qr:
@@ -458,7 +485,7 @@ def create_label_image_template3(qr_data: str, text: str, tape_width_mm: int = 2
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
 
     # Paste QR code (if included)
     if include_qr and qr_img:
@@ -476,7 +503,7 @@ def create_label_image_template3(qr_data: str, text: str, tape_width_mm: int = 2
 
     # Add subtle border (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)
+    border_color = 200
     draw = ImageDraw.Draw(img)
     draw.rectangle(
         [(border_width//2, border_width//2),
@@ -505,15 +532,8 @@ def create_text_only_label(text: str, tape_width_mm: int = 29,
         font_size: Font size in points (used as maximum, will be scaled down if needed)
     """
 
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Add generous padding around text (scaled)
     padding_horizontal = int(60 * scale)
@@ -522,31 +542,16 @@ def create_text_only_label(text: str, tape_width_mm: int = 29,
     # Calculate maximum text height to fit within label
     target_height = label_height_px - (padding_vertical * 2)
 
-    # Binary search for optimal font size to fit text height within constraint
+    # Find the optimal font size to fit text height within constraint
     # Scale font sizes proportionally to tape width
     min_font_size = int(20 * scale)
     max_font_size = int(font_size * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text height using font metrics
-        ascent, descent = font.getmetrics()
-        text_height_measured = ascent + descent
-
-        if text_height_measured <= target_height:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_height, font_line_height)
 
     # Calculate text dimensions with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font = get_font(font_path, optimal_font_size)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
@@ -555,7 +560,7 @@ def create_text_only_label(text: str, tape_width_mm: int = 29,
     img_height = label_height_px
 
     # Create image with white background
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
     draw = ImageDraw.Draw(img)
 
     # Center text both horizontally and vertically
@@ -569,7 +574,7 @@ def create_text_only_label(text: str, tape_width_mm: int = 29,
 
     # Add subtle border around the label (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)  # Light gray
+    border_color = 200  # Light gray
 
     draw.rectangle(
         [(border_width//2, border_width//2),
@@ -596,15 +601,8 @@ def create_vertical_text_label(text: str, tape_width_mm: int = 29,
         tape_width_mm: Tape width in millimeters
         font_path: Path to TrueType font file
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Margins and padding configuration - proportional to tape size
     # Use percentage-based margins to adapt to different tape widths (29mm-62mm)
@@ -624,44 +622,18 @@ def create_vertical_text_label(text: str, tape_width_mm: int = 29,
     # This ensures the rotated text image fits within the label with margins
     target_height = label_height_px - (outer_margin * 2) - (text_img_padding * 2)
 
-    # Binary search for optimal font size (scaled)
+    # Find the optimal font size (scaled)
     min_font_size = int(20 * scale)
     max_font_size = int(500 * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text dimensions
-        dummy = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy)
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-
-        # When rotated 90°, text width becomes the height
-        if text_width <= target_height:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_height, lambda font: measure_text_width(font, text))
 
     # Create text with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
-    # Create temporary image for text with internal padding
-    text_img = Image.new("RGB", (text_width + text_img_padding * 2,
-                                  text_height + text_img_padding * 2), (255, 255, 255))
-    text_draw = ImageDraw.Draw(text_img)
-    text_draw.text((text_img_padding, text_img_padding), text, font=font, fill="black")
+    font = get_font(font_path, optimal_font_size)
 
-    # Rotate text 90° counterclockwise
-    text_img_rotated = text_img.rotate(90, expand=True)
+    # Text rotated 90° counterclockwise, with internal padding on every side
+    text_img_rotated = render_rotated_text(font, text, text_img_padding * 2,
+                                           Image.Transpose.ROTATE_90)
 
     # Calculate final image dimensions
     # Add outer margin on left/right (which affects label length)
@@ -669,7 +641,7 @@ def create_vertical_text_label(text: str, tape_width_mm: int = 29,
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
 
     # Paste rotated text (centered)
     # The rotated image should now fit within label_height with outer_margin clearance
@@ -678,7 +650,7 @@ def create_vertical_text_label(text: str, tape_width_mm: int = 29,
     img.paste(text_img_rotated, (text_x, text_y))
 
     # Add subtle border
-    border_color = (200, 200, 200)
+    border_color = 200
     draw = ImageDraw.Draw(img)
     draw.rectangle(
         [(border_width//2, border_width//2),
@@ -708,15 +680,8 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
         font_size: Font size in points (used as maximum, will be scaled down if needed)
         include_qr: Whether to include QR code (default: True)
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and gaps proportionally
     padding = int(15 * scale)
@@ -727,16 +692,7 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
     qr_size = 0
     if include_qr:
         qr_size = int(label_height_px * 0.65)  # 65% for QR to leave room for text above
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+        qr_img = make_qr_image(qr_data, qr_size)
 
     # Calculate available space for text (must fit: text + gap + QR within label height)
     if include_qr:
@@ -744,31 +700,16 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
     else:
         available_for_text = label_height_px - (padding * 2)
 
-    # Binary search for optimal font size to fit text within available space
+    # Find the optimal font size to fit text within available space
     # Scale font sizes proportionally to tape width
     min_font_size = int(20 * scale)
     max_font_size = int(font_size * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text height using font metrics
-        ascent, descent = font.getmetrics()
-        text_height_measured = ascent + descent
-
-        if text_height_measured <= available_for_text:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      available_for_text, font_line_height)
 
     # Calculate text dimensions with optimal font size
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font = get_font(font_path, optimal_font_size)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
 
     # Use font metrics for accurate vertical spacing
@@ -780,7 +721,8 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
+    draw = ImageDraw.Draw(img)
 
     # Calculate vertical centering for the combined text + QR block
     if include_qr and qr_img:
@@ -788,7 +730,6 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
         start_y = (img_height - total_content_height) // 2
 
         # Draw text on top (centered horizontally)
-        draw = ImageDraw.Draw(img)
         text_x = (img_width - text_width) // 2
 
         text_y = start_y
@@ -800,15 +741,13 @@ def create_label_image_template6(qr_data: str, text: str, tape_width_mm: int = 2
         img.paste(qr_img, (qr_x, qr_y))
     else:
         # Text-only, centered both ways
-        draw = ImageDraw.Draw(img)
         text_x = (img_width - text_width) // 2
         text_y = (img_height - text_height_metrics) // 2
         draw.text((text_x, text_y), text, font=font, fill="black")
 
     # Add border (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)
-    draw = ImageDraw.Draw(img)
+    border_color = 200
     draw.rectangle(
         [(border_width//2, border_width//2),
          (img_width - border_width//2 - 1, img_height - border_width//2 - 1)],
@@ -834,15 +773,8 @@ def create_horizontal_centered_label(text: str, tape_width_mm: int = 29,
         tape_width_mm: Tape width in millimeters
         font_path: Path to TrueType font file
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding proportionally
     padding = int(40 * scale)
@@ -850,39 +782,23 @@ def create_horizontal_centered_label(text: str, tape_width_mm: int = 29,
     # Font size should make text take up ~50% of vertical space
     target_text_height = label_height_px * 0.5
 
-    # Binary search for optimal font size (scaled)
+    # Find the optimal font size (scaled)
     min_font_size = int(20 * scale)
     max_font_size = int(500 * scale)
-    optimal_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        # Measure text dimensions
-        ascent, descent = font.getmetrics()
-        text_height = ascent + descent
-
-        if text_height <= target_text_height:
-            min_font_size = test_font_size
-            optimal_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    optimal_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_text_height, font_line_height)
 
     # Create final image with optimal font
-    font = ImageFont.truetype(font_path, optimal_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font = get_font(font_path, optimal_font_size)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
 
     # Calculate image dimensions
     img_width = text_width + (padding * 2)
     img_height = label_height_px
 
     # Create image with white background
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
     draw = ImageDraw.Draw(img)
 
     # Center text both horizontally and vertically
@@ -896,7 +812,7 @@ def create_horizontal_centered_label(text: str, tape_width_mm: int = 29,
 
     # Add subtle border around the label (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)  # Light gray
+    border_color = 200  # Light gray
 
     draw.rectangle(
         [(border_width//2, border_width//2),
@@ -926,15 +842,8 @@ def create_shelf_label(label_text: str, number: str, tape_width_mm: int = 29,
         tape_width_mm: Tape width in millimeters
         font_path: Path to TrueType font file
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and gaps proportionally
     padding = int(20 * scale)
@@ -943,43 +852,17 @@ def create_shelf_label(label_text: str, number: str, tape_width_mm: int = 29,
     # Calculate optimal font size for vertical text to fit in tape height
     target_height = label_height_px - (padding * 2)
 
-    # Binary search for vertical text font size (scaled)
+    # Find the vertical text font size (scaled)
     min_font_size = int(30 * scale)
     max_font_size = int(200 * scale)
-    vertical_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        dummy = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy)
-        bbox = draw.textbbox((0, 0), label_text, font=font)
-        text_width = bbox[2] - bbox[0]
-
-        # When rotated 90° clockwise, text width becomes vertical dimension
-        if text_width <= target_height:
-            min_font_size = test_font_size
-            vertical_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
-
-    # Create vertical text (rotated 90° clockwise)
-    vertical_font = ImageFont.truetype(font_path, vertical_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), label_text, font=vertical_font)
-    vert_text_width = bbox[2] - bbox[0]
-    vert_text_height = bbox[3] - bbox[1]
-
-    # Create temporary image for vertical text with extra padding (scaled)
-    text_img_padding = int(40 * scale)
-    vert_text_img = Image.new("RGB", (vert_text_width + text_img_padding, vert_text_height + text_img_padding), (255, 255, 255))
-    vert_draw = ImageDraw.Draw(vert_text_img)
-    vert_draw.text((text_img_padding // 2, text_img_padding // 2), label_text, font=vertical_font, fill="black")
+    vertical_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                       target_height, lambda font: measure_text_width(font, label_text))
 
-    # Rotate text 90° clockwise (use -90 for clockwise rotation)
-    vert_text_rotated = vert_text_img.rotate(-90, expand=True)
+    # Create vertical text (rotated 90° clockwise) with extra padding (scaled)
+    vertical_font = get_font(font_path, vertical_font_size)
+    text_img_padding = int(40 * scale)
+    vert_text_rotated = render_rotated_text(vertical_font, label_text, text_img_padding,
+                                            Image.Transpose.ROTATE_270)
 
     # Calculate optimal font size for number to fill most of remaining space
     # Number should be large and prominent
@@ -987,26 +870,12 @@ def create_shelf_label(label_text: str, number: str, tape_width_mm: int = 29,
 
     min_font_size = int(80 * scale)
     max_font_size = int(500 * scale)
-    number_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        ascent, descent = font.getmetrics()
-        text_height = ascent + descent
-
-        if text_height <= number_target_height:
-            min_font_size = test_font_size
-            number_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    number_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                     number_target_height, font_line_height)
 
     # Create number text
-    number_font = ImageFont.truetype(font_path, number_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), number, font=number_font)
+    number_font = get_font(font_path, number_font_size)
+    bbox = text_bbox(number_font, number)
     number_width = bbox[2] - bbox[0]
     number_height = bbox[3] - bbox[1]
 
@@ -1015,7 +884,7 @@ def create_shelf_label(label_text: str, number: str, tape_width_mm: int = 29,
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
 
     # Paste vertical text on left (centered vertically)
     vert_x = padding
@@ -1033,7 +902,7 @@ def create_shelf_label(label_text: str, number: str, tape_width_mm: int = 29,
 
     # Add subtle border (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)
+    border_color = 200
     draw.rectangle(
         [(border_width//2, border_width//2),
          (img_width - border_width//2 - 1, img_height - border_width//2 - 1)],
@@ -1067,15 +936,8 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
         font_path: Path to TrueType font file
         include_qr: Whether to include QR code (default: True)
     """
-    # Get tape width in pixels
-    if tape_width_mm not in TAPE_WIDTHS:
-        raise ValueError(f"Unsupported tape width: {tape_width_mm}mm. "
-                        f"Supported: {list(TAPE_WIDTHS.keys())}")
-
-    label_height_px = TAPE_WIDTHS[tape_width_mm]
-
-    # Calculate scale factor for proportional sizing
-    scale = get_scale_factor(tape_width_mm)
+    # Get tape width in pixels and the scale factor for proportional sizing
+    label_height_px, scale = get_tape_geometry(tape_width_mm)
 
     # Scale padding and gaps proportionally
     padding = int(20 * scale)
@@ -1087,45 +949,22 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
     if include_qr:
         # QR takes up ~65% of height to leave room for text below
         qr_size = int(label_height_px * 0.65)
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        qr_img = qr_img.resize((qr_size, qr_size), Image.Resampling.NEAREST)
+        qr_img = make_qr_image(qr_data, qr_size)
 
     # Calculate storage type text size
     # Text should fit below QR code and be reasonably sized
     available_for_text = label_height_px - qr_size - padding * 2 if include_qr else label_height_px * 0.3
     target_text_height = min(available_for_text * 0.8, label_height_px * 0.2)
 
-    # Binary search for storage type font size (scaled)
+    # Find the storage type font size (scaled)
     min_font_size = int(20 * scale)
     max_font_size = int(150 * scale)
-    storage_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        ascent, descent = font.getmetrics()
-        text_height = ascent + descent
-
-        if text_height <= target_text_height:
-            min_font_size = test_font_size
-            storage_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    storage_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                      target_text_height, font_line_height)
 
     # Create storage type text
-    storage_font = ImageFont.truetype(font_path, storage_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), storage_type, font=storage_font)
+    storage_font = get_font(font_path, storage_font_size)
+    bbox = text_bbox(storage_font, storage_type)
     storage_text_width = bbox[2] - bbox[0]
     storage_ascent, storage_descent = storage_font.getmetrics()
     storage_text_height = storage_ascent + storage_descent
@@ -1139,26 +978,12 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
 
     min_font_size = int(100 * scale)
     max_font_size = int(600 * scale)
-    number_font_size = max_font_size
-
-    while max_font_size - min_font_size > 1:
-        test_font_size = (min_font_size + max_font_size) // 2
-        font = ImageFont.truetype(font_path, test_font_size)
-
-        ascent, descent = font.getmetrics()
-        text_height = ascent + descent
-
-        if text_height <= number_target_height:
-            min_font_size = test_font_size
-            number_font_size = test_font_size
-        else:
-            max_font_size = test_font_size
+    number_font_size = fit_font_size(font_path, min_font_size, max_font_size,
+                                     number_target_height, font_line_height)
 
     # Create number text
-    number_font = ImageFont.truetype(font_path, number_font_size)
-    dummy = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), number, font=number_font)
+    number_font = get_font(font_path, number_font_size)
+    bbox = text_bbox(number_font, number)
     number_width = bbox[2] - bbox[0]
 
     # Calculate final image dimensions
@@ -1166,7 +991,7 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
     img_height = label_height_px
 
     # Create final image
-    img = Image.new("RGB", (img_width, img_height), (255, 255, 255))
+    img = Image.new("L", (img_width, img_height), 255)
     draw = ImageDraw.Draw(img)
 
     # Calculate vertical layout for left section (QR + text stacked)
@@ -1198,7 +1023,7 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
 
     # Add subtle border (scaled)
     border_width = max(2, int(2 * scale))
-    border_color = (200, 200, 200)
+    border_color = 200
     draw.rectangle(
         [(border_width//2, border_width//2),
          (img_width - border_width//2 - 1, img_height - border_width//2 - 1)],
@@ -1209,38 +1034,169 @@ def create_storage_qr_label(qr_data: str, storage_type: str, number: str,
     return img
 
 
+def split_last_word(text):
+    """Split 'Label 12' into ('Label', '12'); text without a space yields (text, '')"""
+    parts = text.rsplit(' ', 1)
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return text, ""
+
+
+def _render_shelf(qr_data, text, tape_width_mm, font_path, font_size, include_qr):
+    """Template 7: shelf label, text split into label and number"""
+    label_text, number = split_last_word(text)
+    return create_shelf_label(
+        label_text=label_text, number=number,
+        tape_width_mm=tape_width_mm, font_path=font_path
+    )
+
+
+def _render_storage_qr(qr_data, text, tape_width_mm, font_path, font_size, include_qr):
+    """Template 8: QR code with storage type below and large number on right"""
+    storage_type, number = split_last_word(text)
+    return create_storage_qr_label(
+        qr_data=qr_data, storage_type=storage_type, number=number,
+        tape_width_mm=tape_width_mm, font_path=font_path, include_qr=include_qr
+    )
+
+
+# Template number -> renderer taking
+# (qr_data, text, tape_width_mm, font_path, font_size, include_qr)
+TEMPLATE_RENDERERS = {
+    1: create_label_image,
+    2: create_label_image_template2,
+    3: create_label_image_template3,
+    4: lambda qr_data, text, tape_width_mm, font_path, font_size, include_qr:
+        create_text_only_label(text, tape_width_mm, font_path, font_size),
+    5: lambda qr_data, text, tape_width_mm, font_path, font_size, include_qr:
+        create_vertical_text_label(text, tape_width_mm, font_path),
+    6: create_label_image_template6,
+    7: _render_shelf,
+    8: _render_storage_qr,
+}
+
+
+def render_template(template: int, qr_data: str, text: str, tape_width_mm: int = 29,
+                    font_path: str = DEFAULT_FONT, font_size: int = 100,
+                    include_qr: bool = True) -> Image.Image:
+    """
+    Render a label with one of the numbered GUI templates (1-8).
+
+    Templates 7 and 8 split text on its last space into label/storage type
+    and number (e.g. "SHELF 2"). Module-level so it can be used from worker
+    threads or processes.
+    """
+    try:
+        renderer = TEMPLATE_RENDERERS[template]
+    except KeyError:
+        raise ValueError(f"Unknown template: {template}") from None
+    return renderer(qr_data, text, tape_width_mm, font_path, font_size, include_qr)
+
+
+# brother_ql threshold, in percent
+PRINT_THRESHOLD = 70
+
+
+def to_print_bitmap(image, threshold: int = PRINT_THRESHOLD) -> Image.Image:
+    """
+    Threshold a label image to 1-bit exactly as brother_ql's convert() would.
+
+    convert() turns the percentage into a level on the inverted greyscale
+    image; pixels above 255 minus that level stay white. Doing this up front
+    hands convert() a mode "1" image, so its rotate/paste/invert passes work
+    on a 1-bit image instead of greyscale, and the printed output is the same.
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    if image.mode in ("RGBA", "LA"):
+        # convert() flattens transparency onto white; do the same before "L"
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    level = min(255, max(0, int((100.0 - threshold) / 100.0 * 255)))
+    cutoff = 255 - level
+    lut = [255 if p > cutoff else 0 for p in range(256)]
+    return image.convert("L").point(lut, mode="1")
+
+
+class MultiPageRaster(BrotherQLRaster):
+    """
+    BrotherQLRaster for multi-page jobs.
+
+    brother_ql's convert() ends every page with 0x1A (end of job) and never
+    advances page_number, so a multi-image job restarts the printer between
+    labels. This ends all but the last page with 0x0C (form feed) and marks
+    pages after the first in the media/quality command, as the QL raster
+    reference specifies. cut_every replaces convert()'s fixed "cut after every
+    label" auto-cut setting; the last label is always cut (cut_at_end).
+    """
+
+    def __init__(self, model, page_count, cut_every=1):
+        super().__init__(model)
+        self.pages_remaining = page_count
+        self.cut_every = cut_every
+
+    def add_cut_every(self, n=1):
+        super().add_cut_every(self.cut_every)
+
+    def add_print(self, last_page=True):
+        self.pages_remaining -= 1
+        super().add_print(last_page=self.pages_remaining <= 0)
+        self.page_number += 1
+
+
+def convert_pages(images, tape_width_mm: int = 29, rotate: int = 90,
+                  cut_every: int = 1) -> bytes:
+    """Convert label images (PIL images or paths) into a single multi-page print job."""
+    # Threshold each distinct image once; copies are the same object repeated
+    bitmaps = {}
+    for image in images:
+        if id(image) not in bitmaps:
+            bitmaps[id(image)] = to_print_bitmap(image)
+
+    qlr = MultiPageRaster(PRINTER_MODEL, len(images), cut_every)
+    return convert(
+        qlr=qlr,
+        images=[bitmaps[id(image)] for image in images],
+        label=str(tape_width_mm),
+        rotate=rotate,
+        threshold=PRINT_THRESHOLD,
+        dither=False,
+        compress=COMPRESS_RASTER,
+        red=False,
+        cut=True,
+    )
+
+
 def print_label(image: Image.Image, tape_width_mm: int = 29,
                 printer: str = DEFAULT_PRINTER, backend: str = DEFAULT_BACKEND,
                 rotate: int = 90):
     """Send the label image to the printer."""
 
-    # Save to temp file
-    temp_path = "/tmp/brother_label.png"
-    image.save(temp_path)
-
-    # Create raster instructions
+    # Create raster instructions (convert() takes the PIL image directly)
     qlr = BrotherQLRaster(PRINTER_MODEL)
 
     instructions = convert(
         qlr=qlr,
-        images=[temp_path],
+        images=[to_print_bitmap(image)],
         label=str(tape_width_mm),  # Use tape width as label parameter
         rotate=rotate,
-        threshold=70,
+        threshold=PRINT_THRESHOLD,
         dither=False,
-        compress=False,
+        compress=COMPRESS_RASTER,
         red=False,
         cut=True,
     )
 
-    # Send to printer (suppress stderr to hide "operating mode" warning)
-    with suppress_stderr():
-        send(
-            instructions=instructions,
-            printer_identifier=printer,
-            backend_identifier=backend,
-            blocking=True
-        )
+    # Send to printer
+    send(
+        instructions=instructions,
+        printer_identifier=printer,
+        backend_identifier=backend,
+        blocking=True
+    )
 
 
 def main():
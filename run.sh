@@ -10,9 +10,15 @@ if [ ! -d ".venv" ]; then
     uv venv
 fi
 
-# Install/update dependencies with uv
-echo "Installing dependencies with uv..."
-uv pip install -r requirements.txt
+# Install/update dependencies with uv, unless Pillow-SIMD has been swapped in:
+# syncing requirements.txt (and brother_ql's own Pillow requirement) would
+# reinstall stock Pillow over it
+if .venv/bin/python3 -c "import importlib.metadata as m; m.version('pillow-simd')" 2>/dev/null; then
+    echo "Pillow-SIMD found - skipping dependency install"
+else
+    echo "Installing dependencies with uv..."
+    uv pip install -r requirements.txt
+fi
 
 # Run the GUI
 exec .venv/bin/python3 app/label_printer_gui.py "$@"
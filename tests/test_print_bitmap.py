@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from print_label import to_print_bitmap  # noqa: E402
+
+
+class ToPrintBitmapTest(unittest.TestCase):
+    def test_transparent_rgba_prints_white(self):
+        image = Image.new("RGBA", (696, 100), (0, 0, 0, 0))
+        bitmap = to_print_bitmap(image)
+        self.assertEqual(bitmap.mode, "1")
+        self.assertEqual(bitmap.getextrema(), (255, 255))
+
+    def test_transparent_la_prints_white(self):
+        image = Image.new("LA", (696, 100), (0, 0))
+        self.assertEqual(to_print_bitmap(image).getextrema(), (255, 255))
+
+    def test_transparent_palette_prints_white(self):
+        image = Image.new("P", (696, 100), 0)
+        image.info["transparency"] = 0
+        self.assertEqual(to_print_bitmap(image).getextrema(), (255, 255))
+
+    def test_opaque_black_stays_black(self):
+        image = Image.new("RGBA", (696, 100), (0, 0, 0, 255))
+        self.assertEqual(to_print_bitmap(image).getextrema(), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()